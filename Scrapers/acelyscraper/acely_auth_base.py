@@ -14,7 +14,7 @@ import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 from dotenv import load_dotenv
 from loguru import logger
 
@@ -28,6 +28,7 @@ class AuthConfig:
     wait_timeout: int = 10
     base_url: str = "https://app.acely.ai"
     admin_console_url: str = "https://app.acely.ai/team/admin-console"
+    page_load_strategy: str = "normal"
 
 
 class AcelyAuthenticator:
@@ -78,7 +79,7 @@ class AcelyAuthenticator:
             options.add_argument("--disable-component-update")
             
             # Use fresh profile for each attempt
-            user_data_dir = f"/tmp/acely_chrome_{attempt_num}_{int(time.time())}"
+            user_data_dir = f"/tmp/acely_chrome_{os.getpid()}_{attempt_num}_{int(time.time())}"
             options.add_argument(f"--user-data-dir={user_data_dir}")
             
             if self.config and self.config.headless:
@@ -86,6 +87,10 @@ class AcelyAuthenticator:
             elif not self.config and os.getenv("HEADLESS_MODE", "True").lower() == "true":
                 options.add_argument("--headless")
             
+            # "eager" returns from driver.get at DOMContentLoaded instead of the full load event
+            if self.config:
+                options.page_load_strategy = self.config.page_load_strategy
+            
             # Set custom user agent
             options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36")
             
@@ -383,6 +388,26 @@ class AcelyAuthenticator:
             logger.error(f"❌ Admin console verification failed: {e}")
             return False
     
+    def find_clickable(self, selectors, timeout=2):
+        """Return (element, selector) for the first XPath selector, in order, whose match is clickable"""
+        conditions = [(selector, EC.element_to_be_clickable((By.XPATH, selector))) for selector in selectors]
+        
+        def first_clickable(driver):
+            for selector, condition in conditions:
+                try:
+                    element = condition(driver)
+                except (NoSuchElementException, StaleElementReferenceException):
+                    continue
+                if element:
+                    return element, selector
+            return False
+        
+        try:
+            return WebDriverWait(self.driver, timeout).until(first_clickable)
+        except TimeoutException:
+            logger.debug(f"No selector became clickable within {timeout}s")
+            return None, None
+    
     def close(self):
         """Clean up driver resources"""
         if self.driver:
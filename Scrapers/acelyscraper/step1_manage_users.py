@@ -54,27 +54,9 @@ class Step1ManageUsers(AcelyAuthenticator):
                 "//button[contains(text(), 'Manage Users')]"
             ]
             
-            manage_users_button = None
-            used_selector = None
-            
-            for selector in selectors:
-                try:
-                    logger.debug(f"Trying selector: {selector}")
-                    elements = self.driver.find_elements(By.XPATH, selector)
-                    
-                    for element in elements:
-                        if element.is_displayed() and element.is_enabled():
-                            manage_users_button = element
-                            used_selector = selector
-                            logger.info(f"✅ Found Manage Users button with selector: {selector}")
-                            break
-                    
-                    if manage_users_button:
-                        break
-                        
-                except Exception as e:
-                    logger.debug(f"Selector {selector} failed: {e}")
-                    continue
+            manage_users_button, used_selector = self.find_clickable(selectors)
+            if manage_users_button:
+                logger.info(f"✅ Found Manage Users button with selector: {used_selector}")
             
             if not manage_users_button:
                 logger.error("❌ Could not find Manage Users button")
@@ -3,6 +3,7 @@
 Step 2: Find students from our email list and click their name links
 """
 
+import re
 import time
 from acely_auth_base import AcelyAuthenticator, AuthConfig
 from selenium.webdriver.common.by import By
@@ -10,6 +11,8 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from loguru import logger
 
+_EMAIL_RE = re.compile(r'[\w.+-]+@[\w-]+\.[\w.-]+')
+
 
 class Step2ClickStudentNames(AcelyAuthenticator):
     """Step 2: Click on student name links for students in our target list"""
@@ -56,24 +59,12 @@ class Step2ClickStudentNames(AcelyAuthenticator):
                 "//a[contains(@class, 'flex') and contains(@href, '/team/admin-console')]"
             ]
             
-            admin_console_link = None
-            for selector in admin_console_selectors:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, selector)
-                    for element in elements:
-                        if element.is_displayed() and element.is_enabled():
-                            admin_console_link = element
-                            logger.info(f"✅ Found Admin Console button with selector: {selector}")
-                            break
-                    if admin_console_link:
-                        break
-                except Exception as e:
-                    logger.debug(f"Selector {selector} failed: {e}")
-                    continue
+            admin_console_link, selector = self.find_clickable(admin_console_selectors)
             
             if not admin_console_link:
                 logger.error("❌ Could not find Admin Console button")
                 return False
+            logger.info(f"✅ Found Admin Console button with selector: {selector}")
             
             # Click Admin Console
             logger.info("🖱️ Clicking Admin Console button...")
@@ -98,24 +89,12 @@ class Step2ClickStudentNames(AcelyAuthenticator):
                 "//button[contains(text(), 'Manage Users')]"
             ]
             
-            manage_users_button = None
-            for selector in manage_users_selectors:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, selector)
-                    for element in elements:
-                        if element.is_displayed() and element.is_enabled():
-                            manage_users_button = element
-                            logger.info(f"✅ Found Manage Users button with selector: {selector}")
-                            break
-                    if manage_users_button:
-                        break
-                except Exception as e:
-                    logger.debug(f"Selector {selector} failed: {e}")
-                    continue
+            manage_users_button, selector = self.find_clickable(manage_users_selectors)
             
             if not manage_users_button:
                 logger.error("❌ Could not find Manage Users button")
                 return False
+            logger.info(f"✅ Found Manage Users button with selector: {selector}")
             
             # Click Manage Users
             logger.info("🖱️ Clicking Manage Users button...")
@@ -147,23 +126,11 @@ class Step2ClickStudentNames(AcelyAuthenticator):
             time.sleep(5)
             
             # Click Manage Users button
-            manage_users_button = None
             selectors = [
                 "//button[text()='Manage Users']",
                 "//button[contains(text(), 'Manage Users')]"
             ]
-            
-            for selector in selectors:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, selector)
-                    for element in elements:
-                        if element.is_displayed() and element.is_enabled():
-                            manage_users_button = element
-                            break
-                    if manage_users_button:
-                        break
-                except:
-                    continue
+            manage_users_button, _ = self.find_clickable(selectors)
             
             if manage_users_button:
                 logger.info("🖱️ Clicking Manage Users button...")
@@ -241,18 +208,12 @@ class Step2ClickStudentNames(AcelyAuthenticator):
             # Process each student row to find our target
             for i, row in enumerate(student_rows):
                 try:
-                    # Look for email in this row
-                    email_elements = row.find_elements(By.XPATH, ".//td[contains(text(), '@')] | .//span[contains(text(), '@')] | .//*[contains(text(), '@')]")
-                    
-                    student_email = None
-                    for email_elem in email_elements:
-                        text = email_elem.text.strip()
-                        if '@' in text and '.' in text:  # Basic email validation
-                            student_email = text.lower()
-                            break
-                    
-                    if not student_email:
+                    # Look for email in this row with a single text fetch
+                    row_text = self.driver.execute_script("return arguments[0].innerText;", row) or ''
+                    email_match = _EMAIL_RE.search(row_text)
+                    if not email_match:
                         continue
+                    student_email = email_match.group(0).lower()
                     
                     # Check if this is our target student
                     if student_email == target_email:
@@ -6,14 +6,367 @@ Step 3: Extract student data from each dashboard page
 import time
 import json
 import os
+import re
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from datetime import datetime
 from acely_auth_base import AcelyAuthenticator, AuthConfig
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from loguru import logger
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+_RE_QUESTIONS = re.compile(r'(\d+)\s+questions?\s+attempted')
+_RE_PCT = re.compile(r'(\d+)%')
+_RE_DIGITS = re.compile(r'(\d+)')
+# Composite scores like "1200 - 1400", and the same with en/em dashes
+_RE_COMPOSITE_SCORE = re.compile(r'^\d+\s*-\s*\d+$')
+_RE_EXTENDED_SCORE = re.compile(r'^\d+[-–—]\d+$')
+_MONTHS = frozenset({
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+})
+_RE_MONTH = re.compile(r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},\s+\d{4}')
+_RE_ACTIVE_TEXT = re.compile(r'text-(?:green|yellow|lime)')
+
+# Day columns of the activity calendar, in display order
+_DAYS = ("Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat")
+
+# Spellings of "not available" the dashboard uses for empty accuracy values
+_NA_TOKENS = frozenset({'N/A', 'NA', 'n/a', 'na', 'N/a', 'n/A'})
+
+# Rows per PostgREST insert request, and scraped students buffered before
+# upload_individual_to_supabase flushes them
+_UPLOAD_BATCH_SIZE = 500
+_INDIVIDUAL_FLUSH_SIZE = 10
+_UPLOAD_THREADS = 2
+
+# acely_students column -> getter over (student_data, data_extracted)
+_FIELD_MAP = (
+    ("name", lambda s, e: s.get("name")),
+    ("email", lambda s, e: s.get("email")),
+    ("url", lambda s, e: s.get("dashboard_url")),
+    ("join_date", lambda s, e: e.get("join_date")),
+    ("most_recent_score", lambda s, e: e.get("most_recent_score")),
+    ("this_week_accuracy", lambda s, e: e.get("this_week_accuracy")),
+    ("last_week_accuracy", lambda s, e: e.get("last_week_accuracy")),
+    ("questions_answered_this_week", lambda s, e: e.get("questions_answered_this_week")),
+    ("questions_answered_last_week", lambda s, e: e.get("questions_answered_last_week")),
+    ("daily_activity", lambda s, e: e.get("daily_activity_calendar")),
+    ("strongest_area", lambda s, e: (e.get("strongest_area") or {}).get("area")),
+    ("weakest_area", lambda s, e: (e.get("weakest_area") or {}).get("area")),
+    ("strongest_area_accuracy", lambda s, e: (e.get("strongest_area") or {}).get("accuracy")),
+    ("weakest_area_accuracy", lambda s, e: (e.get("weakest_area") or {}).get("accuracy")),
+    ("mock_exam_results", lambda s, e: e.get("mock_exam_results")),
+)
+
+# Registered via Page.addScriptToEvaluateOnNewDocument so it runs before the
+# dashboard hydrates. That is before <html> exists, so the observer watches the
+# document itself. A MutationObserver re-reads the summary fields as the SPA renders and
+# flags window.__scrape_done once the summary cards' labels are on the page;
+# fields the student has no value for (e.g. no mock score yet) stay null. The
+# observer survives client-side navigation, so results are tagged with the
+# path they were read from.
+_PRELOAD_EXTRACTOR_JS = """
+(() => {
+    const READY_XPATHS = [
+        "//*[contains(text(), 'Accuracy')]",
+        "//*[contains(text(), 'Questions Answered')]"
+    ];
+    const XPATHS = {
+        join_date: "//*[contains(text(), 'Joined:')]",
+        most_recent_score: "//span[contains(@class, 'decoration-yellow-800')]",
+        accuracy: "//*[contains(text(), 'Accuracy')]/parent::*//*[contains(@class, 'text-3xl') and contains(@class, 'font-medium')]",
+        questions: "//*[contains(text(), 'Questions Answered')]/parent::*//*[contains(@class, 'text-3xl') and contains(@class, 'font-medium')]"
+    };
+    const firstText = (xpath) => {
+        const node = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        const text = node ? (node.innerText || node.textContent || '').trim() : '';
+        return text || null;
+    };
+    let scheduled = false;
+    const run = () => {
+        scheduled = false;
+        if (!location.pathname.includes('/student-dashboard/')) {
+            window.__scrape_done = false;
+            return;
+        }
+        const result = {path: location.pathname};
+        for (const [key, xpath] of Object.entries(XPATHS)) {
+            result[key] = firstText(xpath);
+        }
+        window.__scrape_result = result;
+        window.__scrape_done = READY_XPATHS.every(xpath =>
+            document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue);
+    };
+    const observer = new MutationObserver(() => {
+        if (!scheduled) {
+            scheduled = true;
+            setTimeout(run, 0);
+        }
+    });
+    observer.observe(document, {childList: true, subtree: true, characterData: true});
+})();
+"""
+
+_PRELOAD_RESULT_JS = """
+const result = window.__scrape_result;
+return window.__scrape_done && result && result.path === location.pathname ? result : null;
+"""
+
+_PRELOAD_POLL_INTERVAL = 0.05
+
+# Longest the preload result is waited for before the selectors take over
+_PRELOAD_TIMEOUT = 3
+
+# True once the sections the later extractors probe without waiting have
+# rendered: a calendar week row, the Strongest/Weakest area cards and the
+# Mock Exam Results heading
+_SECTIONS_READY_JS = """
+const hasText = text => document.evaluate(`//*[contains(text(), '${text}')]`, document, null,
+    XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+return !!document.querySelector('div.flex.flex-col.gap-8.w-full div.flex-row.items-center.w-full.justify-between')
+    && ['Strongest', 'Weakest', 'Mock Exam Results'].every(hasText);
+"""
+
+# Longest the dashboard sections are waited for; whatever is missing after that
+# is recorded as not found
+_SECTIONS_TIMEOUT = 5
+
+# Requests the scraper never reads from: images, fonts, video and third-party
+# analytics/chat widgets. Blocked after login so the Google sign-in is untouched
+_BLOCKED_URL_PATTERNS = (
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp4", "*.webm",
+    "*google-analytics*", "*googletagmanager*", "*segment.io*", "*segment.com*",
+    "*intercom*", "*hotjar*", "*sentry.io*",
+)
+
+# Dump every day column of a week row in one round trip: the first tooltip, the
+# first SVG's class, fill flag and parent title, and the class of the first
+# status-coloured SVG. The fill check runs in the browser so the SVG markup is
+# never serialised, and only the seven day columns are returned.
+_DUMP_ROW_JS = """
+const row = arguments[0];
+const activeFill = /fill-(?:green|yellow|lime)/;
+const statusSvg = 'svg.text-green-200, svg.text-yellow-200, svg.text-lime-200, svg.text-neutral-200';
+return [...row.querySelectorAll('div.flex.flex-col.items-center')].slice(0, 7).map(col => {
+    const tooltip = col.querySelector('div.tooltip[data-tip]');
+    const svg = col.querySelector('svg');
+    const status = col.querySelector(statusSvg);
+    return {
+        tip: tooltip ? tooltip.getAttribute('data-tip') : null,
+        cls: svg ? (svg.getAttribute('class') || '') : null,
+        active_fill: svg ? activeFill.test(svg.outerHTML) : false,
+        title: svg && svg.parentElement ? (svg.parentElement.getAttribute('title') || '') : '',
+        status_cls: status ? (status.getAttribute('class') || '') : ''
+    };
+});
+"""
+
+# Container selectors for the Strongest/Weakest area cards, formatted with the
+# card's keyword
+_AREA_CONTAINER_SELECTOR_TMPLS = (
+    # Original selectors
+    "//div[contains(@class, 'rounded-lg') and contains(@class, 'border') and contains(@class, 'border-gray-300') and .//text()[contains(., '{kw}')]]",
+    "//div[contains(@class, 'rounded-lg') and contains(@class, 'border') and .//div[contains(@class, 'text-sm') and contains(@class, 'font-medium') and contains(text(), '{kw}')]]",
+    "//*[contains(text(), '{kw}')]/ancestor::div[contains(@class, 'rounded-lg')]",
+    # More flexible selectors
+    "//div[contains(@class, 'rounded-lg') and .//text()[contains(., '{kw}')]]",
+    "//*[contains(text(), '{kw}')]/parent::*/parent::*",
+    "//*[contains(text(), '{kw}')]/ancestor::div[contains(@class, 'border')]",
+    # Broad search for any container with the keyword
+    "//*[contains(text(), '{kw}')]/ancestor::div[1]",
+    "//*[contains(text(), '{kw}')]/ancestor::div[2]",
+    "//*[contains(text(), '{kw}')]/ancestor::div[3]"
+)
+
+# Container selectors per area card, formatted once at import
+_AREA_CONTAINER_SELECTORS = {
+    keyword: tuple(tmpl.format(kw=keyword) for tmpl in _AREA_CONTAINER_SELECTOR_TMPLS)
+    for keyword in ("Strongest", "Weakest")
+}
+
+# Area name and accuracy selectors, relative to an area card
+_AREA_SELECTORS = (
+    ".//div[contains(@class, 'text-lg') and contains(@class, 'font-medium') and contains(@class, 'text-navy-800')]",
+    ".//div[contains(@class, 'text-lg') and contains(@class, 'font-medium')]",
+    ".//div[contains(@class, 'text-navy-800')]",
+    "./*[2]",  # Often the second child element
+    ".//*[contains(@class, 'truncate')]"
+)
+
+_ACCURACY_SELECTORS = (
+    ".//div[contains(@class, 'text-base') and contains(@class, 'text-neutral-400') and contains(@class, 'font-medium') and contains(text(), 'accuracy')]",
+    ".//div[contains(text(), 'accuracy')]",
+    ".//div[contains(text(), '%')]",
+    "./*[3]",  # Often the third child element
+    ".//*[contains(text(), 'with')]"
+)
+
+# Title, completion date and score selectors, relative to a mock exam card
+_EXAM_TITLE_SELECTORS = (
+    ".//h3[contains(@class, 'text-heading-3')]",
+    ".//h3",
+    ".//*[contains(@class, 'text-heading')]",
+    ".//*[contains(text(), 'Exam') or contains(text(), 'Quiz')]"
+)
+
+_EXAM_DATE_SELECTORS = (
+    ".//span[contains(text(), 'Completed')]",
+    ".//*[contains(text(), 'Completed')]",
+    ".//div[contains(@class, 'text-gray-600') and contains(text(), '202')]",
+    ".//*[contains(text(), '2025') or contains(text(), '2024')]"
+)
+
+_EXAM_SCORE_SELECTORS = (
+    ".//span[contains(@class, 'text-4xl') or contains(@class, 'text-3xl')]",
+    ".//*[contains(@class, 'font-medium') and (contains(@class, 'text-4xl') or contains(@class, 'text-3xl'))]",
+    ".//span[contains(@class, 'font-readex')]",
+    ".//*[text() and string-length(text()) <= 10 and (contains(text(), '0') or contains(text(), '1') or contains(text(), '2') or contains(text(), '3') or contains(text(), '4') or contains(text(), '5') or contains(text(), '6') or contains(text(), '7') or contains(text(), '8') or contains(text(), '9'))]"
+)
+
+_ADMIN_CONSOLE_XPATHS = (
+    "//a[@href='/team/admin-console' and contains(text(), 'Admin Console')]",
+    "//a[contains(@href, '/team/admin-console')]",
+    "//li//a[contains(text(), 'Admin Console')]",
+    "//a[contains(@class, 'flex') and contains(@href, '/team/admin-console')]"
+)
+
+_MANAGE_USERS_XPATHS = (
+    "//button[text()='Manage Users']",
+    "//button[contains(text(), 'Manage Users')]"
+)
+
+# CSS fallbacks for the student table rows and each row's name link, tried in
+# order; rows are finally matched on containing an '@' in their text
+_STUDENT_ROW_CSS = (
+    "tr[class*='border-b']",
+    "table tr:not(:first-child)"
+)
+
+_NAME_LINK_CSS = (
+    "a[href*='/student-dashboard/']",
+    "a[class*='text-blue']"
+)
+
+# Scroll an element into view and click it in one round-trip
+_CLICK_JS = "arguments[0].scrollIntoView({block: 'center'}); arguments[0].click();"
+
+# Shared helpers for the student list scripts below
+_STUDENT_ROWS_JS = """
+const emailRe = /[\\w.+-]+@[\\w-]+\\.[\\w.-]+/;
+function studentRows(rowSelectors) {
+    for (const selector of rowSelectors) {
+        const rows = document.querySelectorAll(selector);
+        if (rows.length) return [...rows];
+    }
+    return [...document.querySelectorAll('tr')].filter(row => (row.innerText || '').includes('@'));
+}
+function nameLink(row, linkSelectors) {
+    for (const selector of linkSelectors) {
+        const link = row.querySelector(selector);
+        if (link) return link;
+    }
+    return null;
+}
+"""
+
+# Scan the student rows in-page for the target email and return its name link
+_FIND_STUDENT_JS = _STUDENT_ROWS_JS + """
+const [target, rowSelectors, linkSelectors] = arguments;
+const rows = studentRows(rowSelectors);
+for (const row of rows) {
+    const match = (row.innerText || '').match(emailRe);
+    if (!match || match[0].toLowerCase() !== target) continue;
+    const link = nameLink(row, linkSelectors);
+    return {
+        found: true,
+        link: link,
+        name: link ? link.innerText.trim() : null,
+        href: link ? link.href : null
+    };
+}
+return {found: false, rows: rows.length};
+"""
+
+# Map every listed student's email to their name link text and dashboard href
+_STUDENT_LINKS_JS = _STUDENT_ROWS_JS + """
+const [rowSelectors, linkSelectors] = arguments;
+const links = {};
+for (const row of studentRows(rowSelectors)) {
+    const match = (row.innerText || '').match(emailRe);
+    if (!match) continue;
+    const link = nameLink(row, linkSelectors);
+    if (link && link.href) links[match[0].toLowerCase()] = {name: link.innerText.trim(), href: link.href};
+}
+return links;
+"""
+
+# Find the rounded-lg card around the deepest element whose normalised text
+# contains the keyword and read its area name and accuracy percentage in one
+# round trip
+_AREA_JS = """
+const keyword = arguments[0];
+const xpath = `//*[contains(normalize-space(string(.)), '${keyword}') and not(*[contains(normalize-space(string(.)), '${keyword}')])]`;
+const matches = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+for (let i = 0; i < matches.snapshotLength; i++) {
+    let container = matches.snapshotItem(i);
+    while (container && !(container.classList && container.classList.contains('rounded-lg'))) {
+        container = container.parentElement;
+    }
+    // Skip cards that are not rendered (offsetParent is null when hidden)
+    if (!container || container.offsetParent === null) continue;
+    const areaElement = container.querySelector('.text-lg.font-medium');
+    const accuracyMatch = container.innerText.match(/(\\d+)%/);
+    if (areaElement && accuracyMatch) {
+        return {area: areaElement.innerText.trim(), accuracy: accuracyMatch[1] + '%'};
+    }
+}
+return null;
+"""
+
+# Flag the exam containers that are rendered and have an exam title or score
+_EXAM_CANDIDATES_JS = """
+return arguments[0].map(container =>
+    container.offsetParent !== null &&
+    container.querySelector('h3, span.text-4xl, span.text-3xl') !== null
+);
+"""
+
+# Read an exam card's title, completion date text and headline score in one
+# round trip
+_EXAM_SNAPSHOT_JS = """
+const container = arguments[0];
+const completedDate = /Completed|(January|February|March|April|May|June|July|August|September|October|November|December)\\s+\\d{1,2},\\s+\\d{4}/;
+const title = container.querySelector('h3');
+const score = container.querySelector('span.text-4xl, span.text-3xl');
+let date = null;
+const walker = document.createTreeWalker(container, NodeFilter.SHOW_TEXT);
+let node;
+while ((node = walker.nextNode())) {
+    if (completedDate.test(node.nodeValue)) {
+        date = node.parentElement.innerText;
+        break;
+    }
+}
+return {
+    title: title ? title.innerText : null,
+    date: date,
+    score: score ? score.innerText : null
+};
+"""
+
 
 class Step3ExtractData(AcelyAuthenticator):
     """Step 3: Extract data from student dashboard pages"""
@@ -23,21 +376,101 @@ class Step3ExtractData(AcelyAuthenticator):
         self.target_emails = []
         self.student_data = {}
         self.not_found_students = []
+        self._preloaded = {}
+        self._last_good_selector = {}
+        self._upload_buffer = []
+        self._upload_pool = None
+        self._upload_futures = []
+        self._student_href_cache = {}
+        self._supabase = None
+        self._supabase_checked = False
+        self.pretty_json = False
+    
+    def get_supabase_client(self):
+        """Create the Supabase client on first use and reuse it afterwards (None if unavailable)"""
+        if self._supabase_checked:
+            return self._supabase
+        self._supabase_checked = True
+        
+        # Load environment variables
+        load_dotenv()
+        
+        # Check if Supabase credentials are available
+        supabase_url = os.getenv("SUPABASE_URL")
+        supabase_key = os.getenv("SUPABASE_ANON_KEY")
+        
+        if not supabase_url or not supabase_key:
+            logger.warning("⚠️ Supabase credentials not found. Skipping Supabase access.")
+            logger.info("💡 Add SUPABASE_URL and SUPABASE_ANON_KEY to your .env file")
+            return None
+        
+        # Import Supabase (only when needed)
+        try:
+            from supabase import create_client
+        except ImportError:
+            logger.warning("⚠️ Supabase library not installed. Skipping Supabase access.")
+            logger.info("💡 Install with: pip install supabase")
+            return None
+        
+        self._supabase = create_client(supabase_url, supabase_key)
+        return self._supabase
+    
+    def install_preload_extractor(self):
+        """Register the summary-field extractor to run on every new document"""
+        try:
+            self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": _PRELOAD_EXTRACTOR_JS})
+            logger.info("✅ Preload extractor registered")
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ Could not register preload extractor: {e}")
+            return False
+    
+    def block_unused_resources(self):
+        """Stop the browser fetching images, fonts and analytics while scraping"""
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(_BLOCKED_URL_PATTERNS)})
+            logger.info("✅ Blocking images, fonts and analytics requests")
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ Could not block unused resources: {e}")
+            return False
+    
+    def _await_dashboard_sections(self):
+        """Wait (briefly) for the calendar, area cards and mock exam section to render"""
+        timeout = min(self.config.wait_timeout, _SECTIONS_TIMEOUT) if self.config else _SECTIONS_TIMEOUT
+        try:
+            WebDriverWait(self.driver, timeout).until(lambda d: d.execute_script(_SECTIONS_READY_JS))
+        except TimeoutException:
+            logger.debug("Not every dashboard section rendered, extracting what is there")
+    
+    def _await_preload_result(self):
+        """Poll the preload extractor until it reports the summary fields for this page"""
+        timeout = min(self.config.wait_timeout, _PRELOAD_TIMEOUT) if self.config else _PRELOAD_TIMEOUT
+        deadline = time.time() + timeout
+        while True:
+            try:
+                result = self.driver.execute_script(_PRELOAD_RESULT_JS)
+            except Exception as e:
+                logger.debug(f"Preload result poll failed: {e}")
+                return {}
+            if result:
+                logger.debug(f"Preload extractor result: {result}")
+                return result
+            if time.time() >= deadline:
+                logger.debug("Preload extractor did not finish, falling back to selectors")
+                return {}
+            time.sleep(_PRELOAD_POLL_INTERVAL)
     
     def load_target_emails(self):
         """Load target student emails from Supabase students table"""
         try:
             # Connect to Supabase
-            load_dotenv()
-            supabase_url = os.getenv("SUPABASE_URL")
-            supabase_key = os.getenv("SUPABASE_ANON_KEY")
+            supabase = self.get_supabase_client()
             
-            if not supabase_url or not supabase_key:
+            if supabase is None:
                 raise ValueError("Missing SUPABASE_URL or SUPABASE_ANON_KEY in environment")
             
-            from supabase import create_client
-            supabase = create_client(supabase_url, supabase_key)
-            
             # Fetch all emails from the students table
             logger.info("🔗 Connecting to Supabase to fetch student emails...")
             response = supabase.table("students").select("email").execute()
@@ -85,6 +518,9 @@ class Step3ExtractData(AcelyAuthenticator):
                 "data_extracted": {}
             }
             
+            # Pick up whatever the preload extractor captured during render
+            self._preloaded = self._await_preload_result()
+            
             # Extract join date
             join_date = self.extract_join_date()
             if join_date:
@@ -101,32 +537,28 @@ class Step3ExtractData(AcelyAuthenticator):
             else:
                 logger.warning(f"  ⚠️ Most recent score not found")
             
-            # Extract this week accuracy
-            this_week_accuracy = self.extract_this_week_accuracy()
+            # Extract this week and last week accuracy (same element)
+            this_week_accuracy, last_week_accuracy = self.extract_this_week_accuracy()
             if this_week_accuracy is not None:
                 student_data["data_extracted"]["this_week_accuracy"] = this_week_accuracy
                 logger.info(f"  ✅ This week accuracy: {this_week_accuracy}")
             else:
                 logger.warning(f"  ⚠️ This week accuracy not found")
             
-            # Extract last week accuracy
-            last_week_accuracy = self.extract_last_week_accuracy()
             if last_week_accuracy is not None:
                 student_data["data_extracted"]["last_week_accuracy"] = last_week_accuracy
                 logger.info(f"  ✅ Last week accuracy: {last_week_accuracy}")
             else:
                 logger.warning(f"  ⚠️ Last week accuracy not found")
             
-            # Extract questions answered this week
-            questions_this_week = self.extract_questions_answered_this_week()
+            # Extract questions answered this week and last week (same element)
+            questions_this_week, questions_last_week = self.extract_questions_answered_this_week()
             if questions_this_week is not None:
                 student_data["data_extracted"]["questions_answered_this_week"] = questions_this_week
                 logger.info(f"  ✅ Questions answered this week: {questions_this_week}")
             else:
                 logger.warning(f"  ⚠️ Questions answered this week not found")
             
-            # Extract questions answered last week
-            questions_last_week = self.extract_questions_answered_last_week()
             if questions_last_week is not None:
                 student_data["data_extracted"]["questions_answered_last_week"] = questions_last_week
                 logger.info(f"  ✅ Questions answered last week: {questions_last_week}")
@@ -183,23 +615,29 @@ class Step3ExtractData(AcelyAuthenticator):
     def extract_join_date(self):
         """Extract the join date from the student dashboard"""
         try:
-            # Look for the join date using the exact element you provided
+            preloaded = self._preloaded.get("join_date")
+            if preloaded and "Joined:" in preloaded:
+                date_part = preloaded.replace("Joined:", "").strip()
+                logger.info(f"✅ Extracted join date: {date_part}")
+                return date_part
+            
+            # Look for the join date, cheapest text anchor first. On a typical
+            # dashboard it matches a single node and we return straight away;
+            # the class-qualified selectors only disambiguate multiple hits.
             join_date_selectors = [
+                "//*[contains(text(), 'Joined:')]",
                 # Using the exact class and text pattern
                 "//div[contains(@class, 'text-neutral-600') and contains(@class, 'text-sm') and contains(@class, 'pt-2') and contains(text(), 'Joined:')]",
-                # Broader search for join date
-                "//div[contains(text(), 'Joined:')]",
-                "//*[contains(text(), 'Joined:')]",
-                # Alternative patterns
-                "//div[contains(@class, 'text-neutral-600') and contains(text(), 'Joined')]",
-                "//span[contains(text(), 'Joined:')]"
+                "//div[contains(@class, 'text-neutral-600') and contains(text(), 'Joined:')]"
             ]
             
+            fallback_date = None
             for selector in join_date_selectors:
                 try:
                     logger.debug(f"Trying join date selector: {selector}")
                     elements = self.driver.find_elements(By.XPATH, selector)
                     
+                    date_parts = []
                     for element in elements:
                         if element.is_displayed():
                             text = element.text.strip()
@@ -207,14 +645,22 @@ class Step3ExtractData(AcelyAuthenticator):
                             
                             # Extract the date from "Joined: September 22, 2024" format
                             if "Joined:" in text:
-                                date_part = text.replace("Joined:", "").strip()
-                                logger.info(f"✅ Extracted join date: {date_part}")
-                                return date_part
+                                date_parts.append(text.replace("Joined:", "").strip())
                     
+                    if len(date_parts) == 1:
+                        logger.info(f"✅ Extracted join date: {date_parts[0]}")
+                        return date_parts[0]
+                    if date_parts and fallback_date is None:
+                        fallback_date = date_parts[0]
+                
                 except Exception as e:
                     logger.debug(f"Selector {selector} failed: {e}")
                     continue
             
+            if fallback_date:
+                logger.info(f"✅ Extracted join date: {fallback_date}")
+                return fallback_date
+            
             logger.warning("⚠️ Join date not found with any selector")
             return None
             
@@ -224,8 +670,18 @@ class Step3ExtractData(AcelyAuthenticator):
     
     def extract_most_recent_score(self):
         """Extract the most recent score from the student dashboard"""
-        import re
         try:
+            preloaded = self._preloaded.get("most_recent_score")
+            if preloaded and self._is_valid_score(preloaded):
+                if preloaded.isdigit():
+                    score = int(preloaded)
+                elif preloaded.replace('.', '', 1).isdigit():
+                    score = float(preloaded)
+                else:
+                    score = preloaded
+                logger.info(f"✅ Extracted most recent score: {score}")
+                return score
+            
             # Look for the most recent score using comprehensive selectors
             score_selectors = [
                 # Most specific - the exact pattern we know
@@ -285,10 +741,7 @@ class Step3ExtractData(AcelyAuthenticator):
                                 return score
                             else:
                                 # Check for composite score formats: "number - number" or "number-number"
-                                import re
-                                # Pattern to match: number (optional spaces) dash (optional spaces) number
-                                composite_pattern = r'^\d+\s*-\s*\d+$'
-                                if re.match(composite_pattern, text):
+                                if _RE_COMPOSITE_SCORE.match(text):
                                     logger.info(f"✅ Extracted most recent score (composite): {text}")
                                     return text  # Return the full composite score string
                     
@@ -312,8 +765,6 @@ class Step3ExtractData(AcelyAuthenticator):
     
     def _is_valid_score(self, text):
         """Check if text represents a valid score format"""
-        import re
-        
         # Remove any extra whitespace
         text = text.strip()
         
@@ -326,22 +777,18 @@ class Step3ExtractData(AcelyAuthenticator):
             return True
             
         # Check for composite score formats: "number-number" or "number - number"
-        composite_pattern = r'^\d+\s*-\s*\d+$'
-        if re.match(composite_pattern, text):
+        if _RE_COMPOSITE_SCORE.match(text):
             return True
             
         # Check for other possible score formats
         # Match patterns like "750-1150", "1200 - 1400", etc.
-        extended_pattern = r'^\d+[-–—]\d+$'  # Includes different types of dashes
-        if re.match(extended_pattern, text):
+        if _RE_EXTENDED_SCORE.match(text):
             return True
             
         return False
     
     def _parse_accuracy_text(self, text):
         """Parse accuracy text to extract this week and last week values"""
-        import re
-        
         # Patterns we might see:
         # "N/A vs. 67% last week" -> this_week: "N/A", last_week: "67"
         # "85% vs. 67% last week" -> this_week: "85", last_week: "67"
@@ -360,7 +807,7 @@ class Step3ExtractData(AcelyAuthenticator):
                 last_week_part = parts[1].strip()
                 
                 # Parse this week part
-                if this_week_part.upper() in ['N/A', 'NA']:
+                if this_week_part in _NA_TOKENS:
                     this_week = "N/A"
                 else:
                     # Extract percentage from this week
@@ -374,7 +821,7 @@ class Step3ExtractData(AcelyAuthenticator):
                     last_week = last_week_match.group(1)
         else:
             # No "vs." - just a single value
-            if text.upper().strip() in ['N/A', 'NA']:
+            if text.strip() in _NA_TOKENS:
                 this_week = "N/A"
             else:
                 # Extract percentage
@@ -385,8 +832,15 @@ class Step3ExtractData(AcelyAuthenticator):
         return this_week, last_week
     
     def extract_this_week_accuracy(self):
-        """Extract the This Week accuracy from the student dashboard"""
+        """Extract (this_week, last_week) accuracy from the student dashboard"""
         try:
+            preloaded = self._preloaded.get("accuracy")
+            if preloaded:
+                this_week, last_week = self._parse_accuracy_text(preloaded)
+                if this_week is not None:
+                    logger.info(f"✅ Extracted this week accuracy: {this_week}")
+                    return this_week, last_week
+            
             # Look for the This Week accuracy section using the specific element structure
             accuracy_selectors = [
                 # Using the exact class structure provided for the accuracy value
@@ -417,23 +871,19 @@ class Step3ExtractData(AcelyAuthenticator):
                                 if parent:
                                     this_week, last_week = self._parse_accuracy_text(text)
                                     if this_week is not None:
-                                        # Store last week for later retrieval
-                                        self._last_week_accuracy = last_week
                                         logger.info(f"✅ Extracted this week accuracy: {this_week}")
-                                        return this_week
+                                        return this_week, last_week
                             except:
                                 # If we can't find "Accuracy" in parent, check if the text looks like accuracy data
-                                if text in ['N/A', 'n/a'] or '%' in text or text.replace('.', '', 1).replace('%', '').isdigit():
+                                if text in _NA_TOKENS or '%' in text or text.replace('.', '', 1).replace('%', '').isdigit():
                                     # Additional check: make sure we're in the "This Week" section
                                     try:
                                         this_week_section = element.find_element(By.XPATH, "./ancestor::*[contains(., 'This Week')]")
                                         if this_week_section:
                                             this_week, last_week = self._parse_accuracy_text(text)
                                             if this_week is not None:
-                                                # Store last week for later retrieval
-                                                self._last_week_accuracy = last_week
                                                 logger.info(f"✅ Extracted this week accuracy: {this_week}")
-                                                return this_week
+                                                return this_week, last_week
                                     except:
                                         continue
                     
@@ -442,31 +892,14 @@ class Step3ExtractData(AcelyAuthenticator):
                     continue
             
             logger.warning("⚠️ This week accuracy not found with any selector")
-            return None
+            return None, None
             
         except Exception as e:
             logger.error(f"❌ Failed to extract this week accuracy: {e}")
-            return None
-    
-    def extract_last_week_accuracy(self):
-        """Extract the Last Week accuracy (parsed from the same element as this week)"""
-        try:
-            # Check if we already parsed this from the this_week_accuracy extraction
-            if hasattr(self, '_last_week_accuracy') and self._last_week_accuracy is not None:
-                logger.info(f"✅ Extracted last week accuracy: {self._last_week_accuracy}")
-                return self._last_week_accuracy
-            
-            logger.warning("⚠️ Last week accuracy not found - no comparison data available")
-            return None
-            
-        except Exception as e:
-            logger.error(f"❌ Failed to extract last week accuracy: {e}")
-            return None
+            return None, None
     
     def _parse_questions_text(self, text):
         """Parse questions answered text to extract this week and last week values"""
-        import re
-        
         # Patterns we might see:
         # "0 vs. 6 last week" -> this_week: 0, last_week: 6
         # "15 vs. 12 last week" -> this_week: 15, last_week: 12
@@ -484,25 +917,32 @@ class Step3ExtractData(AcelyAuthenticator):
                 last_week_part = parts[1].strip()
                 
                 # Parse this week part - extract number
-                this_week_match = re.search(r'(\d+)', this_week_part)
+                this_week_match = _RE_DIGITS.search(this_week_part)
                 if this_week_match:
                     this_week = int(this_week_match.group(1))
                 
                 # Parse last week part - extract number
-                last_week_match = re.search(r'(\d+)', last_week_part)
+                last_week_match = _RE_DIGITS.search(last_week_part)
                 if last_week_match:
                     last_week = int(last_week_match.group(1))
         else:
             # No "vs." - just a single value
-            match = re.search(r'(\d+)', text)
+            match = _RE_DIGITS.search(text)
             if match:
                 this_week = int(match.group(1))
         
         return this_week, last_week
     
     def extract_questions_answered_this_week(self):
-        """Extract Questions Answered This Week from the student dashboard"""
+        """Extract (this_week, last_week) Questions Answered from the student dashboard"""
         try:
+            preloaded = self._preloaded.get("questions")
+            if preloaded:
+                this_week, last_week = self._parse_questions_text(preloaded)
+                if this_week is not None:
+                    logger.info(f"✅ Extracted questions answered this week: {this_week}")
+                    return this_week, last_week
+            
             # Look for the Questions Answered section
             questions_selectors = [
                 # Look for the Questions Answered section in the This Week area
@@ -532,10 +972,8 @@ class Step3ExtractData(AcelyAuthenticator):
                                     if parent:
                                         this_week, last_week = self._parse_questions_text(text)
                                         if this_week is not None:
-                                            # Store last week for later retrieval
-                                            self._last_week_questions = last_week
                                             logger.info(f"✅ Extracted questions answered this week: {this_week}")
-                                            return this_week
+                                            return this_week, last_week
                                 except:
                                     continue
                     
@@ -544,26 +982,11 @@ class Step3ExtractData(AcelyAuthenticator):
                     continue
             
             logger.warning("⚠️ Questions answered this week not found with any selector")
-            return None
+            return None, None
             
         except Exception as e:
             logger.error(f"❌ Failed to extract questions answered this week: {e}")
-            return None
-    
-    def extract_questions_answered_last_week(self):
-        """Extract Questions Answered Last Week (parsed from the same element as this week)"""
-        try:
-            # Check if we already parsed this from the questions_this_week extraction
-            if hasattr(self, '_last_week_questions') and self._last_week_questions is not None:
-                logger.info(f"✅ Extracted questions answered last week: {self._last_week_questions}")
-                return self._last_week_questions
-            
-            logger.warning("⚠️ Questions answered last week not found - no comparison data available")
-            return None
-            
-        except Exception as e:
-            logger.error(f"❌ Failed to extract questions answered last week: {e}")
-            return None
+            return None, None
     
     def extract_daily_activity_calendar(self):
         """Extract the daily activity calendar showing weekly activity patterns"""
@@ -572,24 +995,24 @@ class Step3ExtractData(AcelyAuthenticator):
             
             # Look for the main calendar container using the exact structure you provided
             calendar_selectors = [
-                "//div[contains(@class, 'flex') and contains(@class, 'flex-col') and contains(@class, 'gap-8') and contains(@class, 'w-full')]",
-                "//div[@class='flex flex-col gap-8 w-full']"
+                "div.flex.flex-col.gap-8.w-full",
+                "div[class='flex flex-col gap-8 w-full']"
             ]
             
             calendar_container = None
             for selector in calendar_selectors:
                 try:
-                    containers = self.driver.find_elements(By.XPATH, selector)
+                    containers = self.driver.find_elements(By.CSS_SELECTOR, selector)
                     logger.debug(f"Found {len(containers)} containers with selector: {selector}")
                     
                     for container in containers:
                         if container.is_displayed():
                             # Check if this container has week rows with date patterns
-                            week_rows = container.find_elements(By.XPATH, ".//div[contains(@class, 'flex-row') and contains(@class, 'items-center') and contains(@class, 'w-full') and contains(@class, 'justify-between')]")
+                            week_rows = container.find_elements(By.CSS_SELECTOR, "div.flex-row.items-center.w-full.justify-between")
                             if len(week_rows) > 0:
                                 # Check if any week row contains date patterns
                                 for row in week_rows:
-                                    date_elements = row.find_elements(By.XPATH, ".//div[contains(@class, 'text-sm') and contains(@class, 'font-medium') and contains(@class, 'text-neutral-600')]")
+                                    date_elements = row.find_elements(By.CSS_SELECTOR, "div.text-sm.font-medium.text-neutral-600")
                                     for date_elem in date_elements:
                                         if "/" in date_elem.text and "-" in date_elem.text:
                                             calendar_container = container
@@ -612,12 +1035,12 @@ class Step3ExtractData(AcelyAuthenticator):
             
             # Extract data from each week row
             activity_calendar = {}
-            week_rows = calendar_container.find_elements(By.XPATH, ".//div[contains(@class, 'flex-row') and contains(@class, 'items-center') and contains(@class, 'w-full') and contains(@class, 'justify-between')]")
+            week_rows = calendar_container.find_elements(By.CSS_SELECTOR, "div.flex-row.items-center.w-full.justify-between")
             
             for week_row in week_rows:
                 try:
                     # Find the date range element
-                    date_elements = week_row.find_elements(By.XPATH, ".//div[contains(@class, 'text-sm') and contains(@class, 'font-medium') and contains(@class, 'text-neutral-600')]")
+                    date_elements = week_row.find_elements(By.CSS_SELECTOR, "div.text-sm.font-medium.text-neutral-600")
                     
                     for date_elem in date_elements:
                         week_text = date_elem.text.strip()
@@ -646,54 +1069,43 @@ class Step3ExtractData(AcelyAuthenticator):
             logger.error(f"❌ Failed to extract daily activity calendar: {e}")
             return None
     
+    def _dump_row(self, week_row):
+        """Return one dict per day column of a week row: tip, cls, active_fill, title, status_cls"""
+        return self.driver.execute_script(_DUMP_ROW_JS, week_row) or []
+    
     def _extract_week_activity_new(self, week_row, week_range):
         """Extract activity data for a single week row using the exact HTML structure"""
         try:
-            days = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
             week_data = {}
             
             logger.debug(f"Extracting activity for week: {week_range}")
             
-            # Find all day columns - they have class "flex flex-col items-center"
-            day_columns = week_row.find_elements(By.XPATH, ".//div[contains(@class, 'flex') and contains(@class, 'flex-col') and contains(@class, 'items-center')]")
+            # Dump all day columns - they have class "flex flex-col items-center"
+            day_columns = self._dump_row(week_row)
             logger.debug(f"Found {len(day_columns)} day columns in week row")
             
-            for i, day_column in enumerate(day_columns):
-                if i >= len(days):  # Skip if we have more columns than days
-                    break
-                    
-                day_name = days[i]
+            # The script returns at most one column per day
+            for day_name, day_column in zip(_DAYS, day_columns):
                 activity_status = False
                 questions_attempted = 0
                 
                 try:
-                    # Look for the tooltip with data-tip attribute
-                    tooltip_elements = day_column.find_elements(By.XPATH, ".//div[contains(@class, 'tooltip') and @data-tip]")
-                    
-                    if tooltip_elements:
-                        tooltip = tooltip_elements[0]
-                        data_tip = tooltip.get_attribute("data-tip")
+                    # Look at the tooltip with data-tip attribute
+                    data_tip = day_column["tip"]
+                    if data_tip:
+                        logger.debug(f"Day {day_name} tooltip: {data_tip}")
                         
-                        if data_tip:
-                            logger.debug(f"Day {day_name} tooltip: {data_tip}")
-                            
-                            # Extract question count from tooltip like "55 questions attempted on Jul 13th."
-                            import re
-                            match = re.search(r'(\d+)\s+questions?\s+attempted', data_tip)
+                        # Extract question count from tooltip like "55 questions attempted on Jul 13th."
+                        # (the pattern also covers "0 question(s) attempted")
+                        if "attempted" in data_tip:
+                            match = _RE_QUESTIONS.search(data_tip)
                             if match:
                                 questions_attempted = int(match.group(1))
-                                if questions_attempted > 0:
-                                    activity_status = True
-                            
-                            # Also check for "0 question attempted" (singular)
-                            elif "0 question attempted" in data_tip or "0 questions attempted" in data_tip:
-                                activity_status = False
-                                questions_attempted = 0
+                                activity_status = questions_attempted > 0
                     
                     # Double-check by looking at SVG class for active/inactive status
-                    svg_elements = day_column.find_elements(By.XPATH, ".//svg")
-                    for svg in svg_elements:
-                        class_attr = svg.get_attribute("class") or ""
+                    class_attr = day_column["cls"]
+                    if class_attr is not None:
                         if "text-green-200" in class_attr:
                             activity_status = True
                             logger.debug(f"Day {day_name} confirmed ACTIVE (green SVG)")
@@ -702,7 +1114,6 @@ class Step3ExtractData(AcelyAuthenticator):
                             if questions_attempted == 0:
                                 activity_status = False
                             logger.debug(f"Day {day_name} confirmed INACTIVE (neutral SVG)")
-                        break
                     
                 except Exception as e:
                     logger.debug(f"Error processing day {day_name}: {e}")
@@ -720,55 +1131,43 @@ class Step3ExtractData(AcelyAuthenticator):
         except Exception as e:
             logger.error(f"❌ Failed to extract week activity for {week_range}: {e}")
             return None
-
+    
     def _extract_week_activity_simple(self, week_row, week_range):
         """Extract activity data for a single week row using a simplified approach"""
         try:
-            days = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
             week_data = {}
             
             logger.debug(f"Extracting activity for week: {week_range}")
             
-            # Look for all SVG elements in the week row - these represent the activity dots
-            svg_elements = week_row.find_elements(By.XPATH, ".//svg")
-            logger.debug(f"Found {len(svg_elements)} SVG elements in week row")
+            # Each day column holds an SVG activity dot
+            day_columns = self._dump_row(week_row)
+            logger.debug(f"Found {len(day_columns)} day columns in week row")
             
             # The SVGs should be in order: Sun, Mon, Tue, Wed, Thu, Fri, Sat
-            for i, day_name in enumerate(days):
+            for i, day_name in enumerate(_DAYS):
                 activity_status = False
                 questions_attempted = 0
                 
-                if i < len(svg_elements):
-                    svg = svg_elements[i]
+                if i < len(day_columns):
+                    svg = day_columns[i]
                     
                     # Check if the SVG has active styling (looking for color attributes)
                     # Active days typically have green/yellow colors, inactive are gray
-                    svg_html = svg.get_attribute("outerHTML")
-                    class_attr = svg.get_attribute("class") or ""
+                    class_attr = svg["cls"] or ""
                     
                     # Look for active indicators in the SVG
-                    if ("fill-green" in svg_html or 
-                        "fill-yellow" in svg_html or 
-                        "fill-lime" in svg_html or
-                        "text-green" in class_attr or
-                        "text-yellow" in class_attr or
-                        "text-lime" in class_attr):
+                    if svg["active_fill"] or _RE_ACTIVE_TEXT.search(class_attr):
                         activity_status = True
                         logger.debug(f"Day {day_name} appears ACTIVE based on SVG styling")
                     else:
                         logger.debug(f"Day {day_name} appears INACTIVE")
                         
-                    # Try to get question count from parent element or tooltip
-                    try:
-                        parent_element = svg.find_element(By.XPATH, "./parent::*")
-                        title_attr = parent_element.get_attribute("title")
-                        if title_attr and "question" in title_attr.lower():
-                            import re
-                            match = re.search(r'(\d+)', title_attr)
-                            if match:
-                                questions_attempted = int(match.group(1))
-                    except:
-                        pass
+                    # Try to get question count from the parent element's title
+                    title_attr = svg["title"]
+                    if title_attr and "question" in title_attr.lower():
+                        match = _RE_DIGITS.search(title_attr)
+                        if match:
+                            questions_attempted = int(match.group(1))
                 
                 week_data[day_name] = {
                     "active": activity_status,
@@ -781,55 +1180,39 @@ class Step3ExtractData(AcelyAuthenticator):
         except Exception as e:
             logger.error(f"❌ Failed to extract week activity for {week_range}: {e}")
             return None
-
+    
     def _extract_week_activity(self, week_row, week_range):
         """Extract activity data for a single week row (legacy method)"""
         try:
-            days = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
             week_data = {}
             
-            # Find all day columns in this week row
-            day_columns = week_row.find_elements(By.XPATH, ".//div[contains(@class, 'flex-col') and contains(@class, 'items-center')]")
+            # Dump all day columns in this week row (tooltip text + SVG class)
+            day_columns = self._dump_row(week_row)
             
-            for i, day_column in enumerate(day_columns):
-                if i < len(days):  # Only process the 7 days of the week
-                    day_name = days[i]
-                    
-                    # Look for SVG elements that represent activity bubbles
-                    svg_elements = day_column.find_elements(By.XPATH, ".//svg")
-                    
-                    activity_status = "inactive"  # Default to inactive
-                    questions_attempted = 0
-                    
-                    for svg in svg_elements:
-                        # Check the color class to determine activity
-                        class_attr = svg.get_attribute("class")
-                        
-                        if class_attr:
-                            if ("text-green-200" in class_attr or 
-                                "text-yellow-200" in class_attr or 
-                                "text-lime-200" in class_attr):
-                                activity_status = "active"
-                                
-                                # Try to extract question count from tooltip
-                                tooltip_element = day_column.find_element(By.XPATH, ".//div[contains(@class, 'tooltip')]")
-                                if tooltip_element:
-                                    tooltip_text = tooltip_element.get_attribute("data-tip")
-                                    if tooltip_text:
-                                        # Extract number from tooltip like "44 questions attempted on Jul 21st."
-                                        import re
-                                        match = re.search(r'(\d+)\s+questions?\s+attempted', tooltip_text)
-                                        if match:
-                                            questions_attempted = int(match.group(1))
-                                break
-                            elif "text-neutral-200" in class_attr:
-                                activity_status = "inactive"
-                                break
+            # The script returns at most one column per day
+            for day_name, day_column in zip(_DAYS, day_columns):
+                activity_status = "inactive"  # Default to inactive
+                questions_attempted = 0
+                
+                # Check the color class of the activity bubble to determine activity
+                class_attr = day_column["status_cls"]
+                if ("text-green-200" in class_attr or 
+                    "text-yellow-200" in class_attr or 
+                    "text-lime-200" in class_attr):
+                    activity_status = "active"
                     
-                    week_data[day_name] = {
-                        "active": activity_status == "active",
-                        "questions_attempted": questions_attempted
-                    }
+                    # Try to extract question count from tooltip
+                    tooltip_text = day_column["tip"]
+                    if tooltip_text:
+                        # Extract number from tooltip like "44 questions attempted on Jul 21st."
+                        match = _RE_QUESTIONS.search(tooltip_text)
+                        if match:
+                            questions_attempted = int(match.group(1))
+                
+                week_data[day_name] = {
+                    "active": activity_status == "active",
+                    "questions_attempted": questions_attempted
+                }
             
             return week_data
             
@@ -837,212 +1220,115 @@ class Step3ExtractData(AcelyAuthenticator):
             logger.debug(f"Failed to extract week activity for {week_range}: {e}")
             return None
     
-    def extract_strongest_area(self):
-        """Extract the strongest academic area and its accuracy"""
+    def _extract_area_js(self, keyword):
+        """Read the area name and accuracy of the card labelled with keyword in one script"""
         try:
-            # Look for the "Strongest" section with more flexible selectors
-            strongest_selectors = [
-                # Original selectors
-                "//div[contains(@class, 'rounded-lg') and contains(@class, 'border') and contains(@class, 'border-gray-300') and .//text()[contains(., 'Strongest')]]",
-                "//div[contains(@class, 'rounded-lg') and contains(@class, 'border') and .//div[contains(@class, 'text-sm') and contains(@class, 'font-medium') and contains(text(), 'Strongest')]]",
-                "//*[contains(text(), 'Strongest')]/ancestor::div[contains(@class, 'rounded-lg')]",
-                # More flexible selectors
-                "//div[contains(@class, 'rounded-lg') and .//text()[contains(., 'Strongest')]]",
-                "//*[contains(text(), 'Strongest')]/parent::*/parent::*",
-                "//*[contains(text(), 'Strongest')]/ancestor::div[contains(@class, 'border')]",
-                # Broad search for any container with "Strongest"
-                "//*[contains(text(), 'Strongest')]/ancestor::div[1]",
-                "//*[contains(text(), 'Strongest')]/ancestor::div[2]",
-                "//*[contains(text(), 'Strongest')]/ancestor::div[3]"
-            ]
-            
-            logger.debug("🔍 Searching for Strongest area section...")
-            
-            for i, selector in enumerate(strongest_selectors):
-                try:
-                    logger.debug(f"Trying strongest selector {i+1}: {selector}")
-                    containers = self.driver.find_elements(By.XPATH, selector)
-                    logger.debug(f"Found {len(containers)} containers with selector {i+1}")
-                    
-                    for j, container in enumerate(containers):
-                        if container.is_displayed():
-                            logger.debug(f"Container {j+1} is displayed, extracting text...")
-                            container_text = container.text.strip()
-                            logger.debug(f"Container {j+1} text: '{container_text[:100]}...'")
-                            
-                            # Look for area name - try multiple patterns
-                            area_elements = []
-                            area_selectors = [
-                                ".//div[contains(@class, 'text-lg') and contains(@class, 'font-medium') and contains(@class, 'text-navy-800')]",
-                                ".//div[contains(@class, 'text-lg') and contains(@class, 'font-medium')]",
-                                ".//div[contains(@class, 'text-navy-800')]",
-                                "./*[2]",  # Often the second child element
-                                ".//*[contains(@class, 'truncate')]"
-                            ]
-                            
-                            for area_sel in area_selectors:
-                                try:
-                                    area_elements = container.find_elements(By.XPATH, area_sel)
-                                    if area_elements:
-                                        logger.debug(f"Found {len(area_elements)} area elements with selector: {area_sel}")
-                                        break
-                                except:
-                                    continue
-                            
-                            # Look for accuracy text - try multiple patterns  
-                            accuracy_elements = []
-                            accuracy_selectors = [
-                                ".//div[contains(@class, 'text-base') and contains(@class, 'text-neutral-400') and contains(@class, 'font-medium') and contains(text(), 'accuracy')]",
-                                ".//div[contains(text(), 'accuracy')]",
-                                ".//div[contains(text(), '%')]",
-                                "./*[3]",  # Often the third child element
-                                ".//*[contains(text(), 'with')]"
-                            ]
-                            
-                            for acc_sel in accuracy_selectors:
-                                try:
-                                    accuracy_elements = container.find_elements(By.XPATH, acc_sel)
-                                    if accuracy_elements:
-                                        logger.debug(f"Found {len(accuracy_elements)} accuracy elements with selector: {acc_sel}")
-                                        break
-                                except:
-                                    continue
-                            
-                            if area_elements and accuracy_elements:
-                                area_name = area_elements[0].text.strip()
-                                accuracy_text = accuracy_elements[0].text.strip()
-                                
-                                logger.debug(f"Raw area name: '{area_name}'")
-                                logger.debug(f"Raw accuracy text: '{accuracy_text}'")
-                                
-                                # Extract percentage from text like "with 100% accuracy"
-                                import re
-                                accuracy_match = re.search(r'(\d+)%', accuracy_text)
-                                accuracy = accuracy_match.group(1) + "%" if accuracy_match else accuracy_text
-                                
-                                if area_name and accuracy:
-                                    result = {
-                                        "area": area_name,
-                                        "accuracy": accuracy
-                                    }
-                                    
-                                    logger.info(f"✅ Extracted strongest area: {area_name} with {accuracy}")
-                                    return result
-                    
-                except Exception as e:
-                    logger.debug(f"Strongest area selector {i+1} failed: {e}")
-                    continue
-            
-            logger.warning("⚠️ Strongest area not found with any selector")
-            return None
-            
+            result = self.driver.execute_script(_AREA_JS, keyword)
         except Exception as e:
-            logger.error(f"❌ Failed to extract strongest area: {e}")
+            logger.debug(f"{keyword} area script failed: {e}")
             return None
+        
+        if result and result.get("area") and result.get("accuracy"):
+            return {
+                "area": result["area"],
+                "accuracy": result["accuracy"]
+            }
+        return None
     
-    def extract_weakest_area(self):
-        """Extract the weakest academic area and its accuracy"""
+    def _read_area_container(self, container):
+        """Read the area name and accuracy from a Strongest/Weakest card element"""
+        # Look for area name - try multiple patterns
+        area_elements = []
+        for area_sel in _AREA_SELECTORS:
+            try:
+                area_elements = container.find_elements(By.XPATH, area_sel)
+                if area_elements:
+                    logger.debug(f"Found {len(area_elements)} area elements with selector: {area_sel}")
+                    break
+            except:
+                continue
+        
+        # Look for accuracy text - try multiple patterns  
+        accuracy_elements = []
+        for acc_sel in _ACCURACY_SELECTORS:
+            try:
+                accuracy_elements = container.find_elements(By.XPATH, acc_sel)
+                if accuracy_elements:
+                    logger.debug(f"Found {len(accuracy_elements)} accuracy elements with selector: {acc_sel}")
+                    break
+            except:
+                continue
+        
+        if not (area_elements and accuracy_elements):
+            return None
+        
+        area_name = area_elements[0].text.strip()
+        accuracy_text = accuracy_elements[0].text.strip()
+        
+        logger.debug(f"Raw area name: '{area_name}'")
+        logger.debug(f"Raw accuracy text: '{accuracy_text}'")
+        
+        # Extract percentage from text like "with 100% accuracy"
+        accuracy_match = _RE_PCT.search(accuracy_text)
+        accuracy = accuracy_match.group(1) + "%" if accuracy_match else accuracy_text
+        
+        if area_name and accuracy:
+            return {
+                "area": area_name,
+                "accuracy": accuracy
+            }
+        return None
+    
+    def _extract_area(self, keyword):
+        """Extract the academic area and accuracy from the card labelled with keyword"""
+        label = keyword.lower()
         try:
-            # Look for the "Weakest" section with more flexible selectors
-            weakest_selectors = [
-                # Original selectors
-                "//div[contains(@class, 'rounded-lg') and contains(@class, 'border') and contains(@class, 'border-gray-300') and .//text()[contains(., 'Weakest')]]",
-                "//div[contains(@class, 'rounded-lg') and contains(@class, 'border') and .//div[contains(@class, 'text-sm') and contains(@class, 'font-medium') and contains(text(), 'Weakest')]]",
-                "//*[contains(text(), 'Weakest')]/ancestor::div[contains(@class, 'rounded-lg')]",
-                # More flexible selectors
-                "//div[contains(@class, 'rounded-lg') and .//text()[contains(., 'Weakest')]]",
-                "//*[contains(text(), 'Weakest')]/parent::*/parent::*",
-                "//*[contains(text(), 'Weakest')]/ancestor::div[contains(@class, 'border')]",
-                # Broad search for any container with "Weakest"
-                "//*[contains(text(), 'Weakest')]/ancestor::div[1]",
-                "//*[contains(text(), 'Weakest')]/ancestor::div[2]",
-                "//*[contains(text(), 'Weakest')]/ancestor::div[3]"
-            ]
+            result = self._extract_area_js(keyword)
+            if result:
+                logger.info(f"✅ Extracted {label} area: {result['area']} with {result['accuracy']}")
+                return result
             
-            logger.debug("🔍 Searching for Weakest area section...")
+            logger.debug(f"🔍 Searching for {keyword} area section...")
             
-            for i, selector in enumerate(weakest_selectors):
+            for i, selector in enumerate(_AREA_CONTAINER_SELECTORS[keyword]):
                 try:
-                    logger.debug(f"Trying weakest selector {i+1}: {selector}")
+                    logger.debug(f"Trying {label} selector {i+1}: {selector}")
                     containers = self.driver.find_elements(By.XPATH, selector)
                     logger.debug(f"Found {len(containers)} containers with selector {i+1}")
                     
                     for j, container in enumerate(containers):
                         if container.is_displayed():
-                            logger.debug(f"Container {j+1} is displayed, extracting text...")
-                            container_text = container.text.strip()
-                            logger.debug(f"Container {j+1} text: '{container_text[:100]}...'")
-                            
-                            # Look for area name - try multiple patterns
-                            area_elements = []
-                            area_selectors = [
-                                ".//div[contains(@class, 'text-lg') and contains(@class, 'font-medium') and contains(@class, 'text-navy-800')]",
-                                ".//div[contains(@class, 'text-lg') and contains(@class, 'font-medium')]",
-                                ".//div[contains(@class, 'text-navy-800')]",
-                                "./*[2]",  # Often the second child element
-                                ".//*[contains(@class, 'truncate')]"
-                            ]
-                            
-                            for area_sel in area_selectors:
-                                try:
-                                    area_elements = container.find_elements(By.XPATH, area_sel)
-                                    if area_elements:
-                                        logger.debug(f"Found {len(area_elements)} area elements with selector: {area_sel}")
-                                        break
-                                except:
-                                    continue
-                            
-                            # Look for accuracy text - try multiple patterns  
-                            accuracy_elements = []
-                            accuracy_selectors = [
-                                ".//div[contains(@class, 'text-base') and contains(@class, 'text-neutral-400') and contains(@class, 'font-medium') and contains(text(), 'accuracy')]",
-                                ".//div[contains(text(), 'accuracy')]",
-                                ".//div[contains(text(), '%')]",
-                                "./*[3]",  # Often the third child element
-                                ".//*[contains(text(), 'with')]"
-                            ]
+                            # Lazy so the text is only fetched when DEBUG logging is on
+                            logger.opt(lazy=True).debug(
+                                "Container {} text: '{}...'",
+                                lambda: j+1,
+                                lambda: container.text.strip()[:100]
+                            )
                             
-                            for acc_sel in accuracy_selectors:
-                                try:
-                                    accuracy_elements = container.find_elements(By.XPATH, acc_sel)
-                                    if accuracy_elements:
-                                        logger.debug(f"Found {len(accuracy_elements)} accuracy elements with selector: {acc_sel}")
-                                        break
-                                except:
-                                    continue
-                            
-                            if area_elements and accuracy_elements:
-                                area_name = area_elements[0].text.strip()
-                                accuracy_text = accuracy_elements[0].text.strip()
-                                
-                                logger.debug(f"Raw area name: '{area_name}'")
-                                logger.debug(f"Raw accuracy text: '{accuracy_text}'")
-                                
-                                # Extract percentage from text like "with 50% accuracy"
-                                import re
-                                accuracy_match = re.search(r'(\d+)%', accuracy_text)
-                                accuracy = accuracy_match.group(1) + "%" if accuracy_match else accuracy_text
-                                
-                                if area_name and accuracy:
-                                    result = {
-                                        "area": area_name,
-                                        "accuracy": accuracy
-                                    }
-                                    
-                                    logger.info(f"✅ Extracted weakest area: {area_name} with {accuracy}")
-                                    return result
+                            result = self._read_area_container(container)
+                            if result:
+                                logger.info(f"✅ Extracted {label} area: {result['area']} with {result['accuracy']}")
+                                return result
                     
                 except Exception as e:
-                    logger.debug(f"Weakest area selector {i+1} failed: {e}")
+                    logger.debug(f"{keyword} area selector {i+1} failed: {e}")
                     continue
             
-            logger.warning("⚠️ Weakest area not found with any selector")
+            logger.warning(f"⚠️ {keyword} area not found with any selector")
             return None
             
         except Exception as e:
-            logger.error(f"❌ Failed to extract weakest area: {e}")
+            logger.error(f"❌ Failed to extract {label} area: {e}")
             return None
     
+    def extract_strongest_area(self):
+        """Extract the strongest academic area and its accuracy"""
+        return self._extract_area("Strongest")
+    
+    def extract_weakest_area(self):
+        """Extract the weakest academic area and its accuracy"""
+        return self._extract_area("Weakest")
+    
     def extract_mock_exam_results(self):
         """Extract all mock exam results from the student dashboard"""
         try:
@@ -1067,20 +1353,10 @@ class Step3ExtractData(AcelyAuthenticator):
                     exam_containers = self.driver.find_elements(By.XPATH, selector)
                     logger.debug(f"Found {len(exam_containers)} exam containers with selector {i+1}")
                     
-                    if len(exam_containers) > 0:
-                        for j, container in enumerate(exam_containers):
-                            if container.is_displayed():
-                                logger.debug(f"Processing exam container {j+1}")
-                                
-                                # Extract exam data from this container
-                                exam_data = self._extract_single_exam_data(container, j+1)
-                                if exam_data:
-                                    mock_exams.append(exam_data)
-                                    logger.debug(f"Successfully extracted exam {j+1}: {exam_data}")
-                        
-                        # If we found exams with this selector, break and use them
-                        if mock_exams:
-                            break
+                    # If we found exams with this selector, use them
+                    mock_exams = list(self._iter_exam_data(exam_containers))
+                    if mock_exams:
+                        break
                     
                 except Exception as e:
                     logger.debug(f"Mock exam selector {i+1} failed: {e}")
@@ -1097,6 +1373,49 @@ class Step3ExtractData(AcelyAuthenticator):
             logger.error(f"❌ Failed to extract mock exam results: {e}")
             return None
     
+    def _iter_exam_data(self, exam_containers):
+        """Yield exam data for each visible container that looks like an exam card"""
+        if not exam_containers:
+            return
+        
+        # One round trip decides which containers are worth a full extraction
+        candidates = self.driver.execute_script(_EXAM_CANDIDATES_JS, exam_containers)
+        
+        for j, (container, is_candidate) in enumerate(zip(exam_containers, candidates)):
+            if not is_candidate:
+                continue
+            
+            logger.debug(f"Processing exam container {j+1}")
+            
+            # Extract exam data from this container
+            exam_data = self._extract_single_exam_data(container, j+1)
+            if exam_data:
+                logger.debug(f"Successfully extracted exam {j+1}: {exam_data}")
+                yield exam_data
+    
+    def _is_exam_score(self, text):
+        """Check for a 2-4 digit score or score range like "1200-1400" without a regex"""
+        if '-' in text:
+            low, _, high = text.partition('-')
+            return (low.isdigit() and high.isdigit() and
+                    2 <= len(low) <= 4 and 2 <= len(high) <= 4)
+        return text.isdigit() and 2 <= len(text) <= 4
+    
+    def _parse_completion_date(self, date_text):
+        """Extract just the date part from text like "Completed July 21, 2025" """
+        if date_text.startswith("Completed "):
+            remainder = date_text[len("Completed "):].lstrip()
+        else:
+            remainder = date_text
+        
+        # Only run the month regex when the text actually starts with a month
+        first_word = remainder.split(None, 1)[0] if remainder else ""
+        if first_word in _MONTHS:
+            date_match = _RE_MONTH.match(remainder)
+            if date_match:
+                return date_match.group(0)
+        return date_text
+    
     def _extract_single_exam_data(self, container, exam_number):
         """Extract data from a single mock exam container"""
         try:
@@ -1107,72 +1426,64 @@ class Step3ExtractData(AcelyAuthenticator):
                 "score": None
             }
             
-            # Extract exam title
-            title_selectors = [
-                ".//h3[contains(@class, 'text-heading-3')]",
-                ".//h3",
-                ".//*[contains(@class, 'text-heading')]",
-                ".//*[contains(text(), 'Exam') or contains(text(), 'Quiz')]"
-            ]
+            # Read title, completion date and score in one round trip
+            snapshot = self.driver.execute_script(_EXAM_SNAPSHOT_JS, container) or {}
             
-            for title_sel in title_selectors:
-                try:
-                    title_elements = container.find_elements(By.XPATH, title_sel)
-                    if title_elements:
-                        exam_data["exam_title"] = title_elements[0].text.strip()
-                        logger.debug(f"Found exam title: '{exam_data['exam_title']}'")
-                        break
-                except:
-                    continue
+            title_text = (snapshot.get("title") or "").strip()
+            if title_text:
+                exam_data["exam_title"] = title_text
             
-            # Extract completion date
-            date_selectors = [
-                ".//span[contains(text(), 'Completed')]",
-                ".//*[contains(text(), 'Completed')]",
-                ".//div[contains(@class, 'text-gray-600') and contains(text(), '202')]",
-                ".//*[contains(text(), '2025') or contains(text(), '2024')]"
-            ]
+            date_text = (snapshot.get("date") or "").strip()
+            if date_text:
+                exam_data["completion_date"] = self._parse_completion_date(date_text)
             
-            for date_sel in date_selectors:
-                try:
-                    date_elements = container.find_elements(By.XPATH, date_sel)
-                    if date_elements:
-                        date_text = date_elements[0].text.strip()
-                        # Extract just the date part from "Completed July 21, 2025"
-                        import re
-                        date_match = re.search(r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},\s+\d{4}', date_text)
-                        if date_match:
-                            exam_data["completion_date"] = date_match.group(0)
-                        else:
-                            exam_data["completion_date"] = date_text
-                        logger.debug(f"Found completion date: '{exam_data['completion_date']}'")
-                        break
-                except:
-                    continue
+            score_text = (snapshot.get("score") or "").strip()
+            if self._is_exam_score(score_text):
+                exam_data["score"] = score_text
             
-            # Extract score
-            score_selectors = [
-                ".//span[contains(@class, 'text-4xl') or contains(@class, 'text-3xl')]",
-                ".//*[contains(@class, 'font-medium') and (contains(@class, 'text-4xl') or contains(@class, 'text-3xl'))]",
-                ".//span[contains(@class, 'font-readex')]",
-                ".//*[text() and string-length(text()) <= 10 and (contains(text(), '0') or contains(text(), '1') or contains(text(), '2') or contains(text(), '3') or contains(text(), '4') or contains(text(), '5') or contains(text(), '6') or contains(text(), '7') or contains(text(), '8') or contains(text(), '9'))]"
-            ]
+            logger.debug(f"Exam snapshot: {exam_data}")
             
-            for score_sel in score_selectors:
-                try:
-                    score_elements = container.find_elements(By.XPATH, score_sel)
-                    for score_elem in score_elements:
-                        score_text = score_elem.text.strip()
-                        # Check if this looks like a score (number or number range)
-                        import re
-                        if re.match(r'^\d{2,4}(-\d{2,4})?$', score_text):
-                            exam_data["score"] = score_text
-                            logger.debug(f"Found score: '{exam_data['score']}'")
+            # Fall back to selectors for an exam title
+            if not exam_data["exam_title"]:
+                for title_sel in _EXAM_TITLE_SELECTORS:
+                    try:
+                        title_elements = container.find_elements(By.XPATH, title_sel)
+                        if title_elements:
+                            exam_data["exam_title"] = title_elements[0].text.strip()
+                            logger.debug(f"Found exam title: '{exam_data['exam_title']}'")
                             break
-                    if exam_data["score"]:
-                        break
-                except:
-                    continue
+                    except:
+                        continue
+            
+            # Fall back to selectors for a completion date
+            if not exam_data["completion_date"]:
+                for date_sel in _EXAM_DATE_SELECTORS:
+                    try:
+                        date_elements = container.find_elements(By.XPATH, date_sel)
+                        if date_elements:
+                            date_text = date_elements[0].text.strip()
+                            exam_data["completion_date"] = self._parse_completion_date(date_text)
+                            logger.debug(f"Found completion date: '{exam_data['completion_date']}'")
+                            break
+                    except:
+                        continue
+            
+            # Fall back to selectors for a score
+            if not exam_data["score"]:
+                for score_sel in _EXAM_SCORE_SELECTORS:
+                    try:
+                        score_elements = container.find_elements(By.XPATH, score_sel)
+                        for score_elem in score_elements:
+                            score_text = score_elem.text.strip()
+                            # Check if this looks like a score (number or number range)
+                            if self._is_exam_score(score_text):
+                                exam_data["score"] = score_text
+                                logger.debug(f"Found score: '{exam_data['score']}'")
+                                break
+                        if exam_data["score"]:
+                            break
+                    except:
+                        continue
             
             # Only return the exam data if we have at least title and score
             if exam_data["exam_title"] and exam_data["score"]:
@@ -1185,6 +1496,32 @@ class Step3ExtractData(AcelyAuthenticator):
             logger.debug(f"Failed to extract single exam data: {e}")
             return None
     
+    def _ordered_selectors(self, key, selectors):
+        """Yield selectors with the one that last matched for this key first"""
+        last_good = self._last_good_selector.get(key)
+        if last_good:
+            yield last_good
+        for selector in selectors:
+            if selector != last_good:
+                yield selector
+    
+    def _wait_for_clickable(self, key, selectors):
+        """Wait until any of the XPath selectors, last-good first, matches a clickable element"""
+        timeout = self.config.wait_timeout if self.config else AuthConfig.wait_timeout
+        element, selector = self.find_clickable(list(self._ordered_selectors(key, selectors)), timeout)
+        if selector:
+            self._last_good_selector[key] = selector
+        return element
+    
+    def _wait_for_student_list(self):
+        """Wait until the student table has rendered at least one row"""
+        try:
+            self.wait.until(EC.presence_of_element_located((By.XPATH, "//tr[contains(., '@')]")))
+            return True
+        except TimeoutException:
+            logger.warning("⚠️ Student list did not load in time")
+            return False
+    
     def navigate_back_to_student_list(self):
         """Navigate back to student list via Admin Console -> Manage Users"""
         try:
@@ -1193,70 +1530,34 @@ class Step3ExtractData(AcelyAuthenticator):
             # Step 1: Click Admin Console button
             logger.info("🖱️ Looking for Admin Console button...")
             
-            admin_console_selectors = [
-                "//a[@href='/team/admin-console' and contains(text(), 'Admin Console')]",
-                "//a[contains(@href, '/team/admin-console')]",
-                "//li//a[contains(text(), 'Admin Console')]",
-                "//a[contains(@class, 'flex') and contains(@href, '/team/admin-console')]"
-            ]
-            
-            admin_console_link = None
-            for selector in admin_console_selectors:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, selector)
-                    for element in elements:
-                        if element.is_displayed() and element.is_enabled():
-                            admin_console_link = element
-                            logger.info(f"✅ Found Admin Console button")
-                            break
-                    if admin_console_link:
-                        break
-                except Exception as e:
-                    continue
+            admin_console_link = self._wait_for_clickable("admin_console", _ADMIN_CONSOLE_XPATHS)
             
             if not admin_console_link:
                 logger.error("❌ Could not find Admin Console button")
                 return False
+            logger.info(f"✅ Found Admin Console button")
             
             # Click Admin Console
             logger.info("🖱️ Clicking Admin Console button...")
-            self.driver.execute_script("arguments[0].scrollIntoView(true);", admin_console_link)
-            time.sleep(1)
-            admin_console_link.click()
-            time.sleep(3)
+            self.driver.execute_script(_CLICK_JS, admin_console_link)
             
             # Step 2: Click Manage Users button
             logger.info("🖱️ Looking for Manage Users button...")
             
-            manage_users_selectors = [
-                "//button[text()='Manage Users']",
-                "//button[contains(text(), 'Manage Users')]"
-            ]
-            
-            manage_users_button = None
-            for selector in manage_users_selectors:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, selector)
-                    for element in elements:
-                        if element.is_displayed() and element.is_enabled():
-                            manage_users_button = element
-                            logger.info(f"✅ Found Manage Users button")
-                            break
-                    if manage_users_button:
-                        break
-                except Exception as e:
-                    continue
+            # Waits out the Admin Console page load
+            manage_users_button = self._wait_for_clickable("manage_users", _MANAGE_USERS_XPATHS)
             
             if not manage_users_button:
                 logger.error("❌ Could not find Manage Users button")
                 return False
+            logger.info(f"✅ Found Manage Users button")
             
             # Click Manage Users
             logger.info("🖱️ Clicking Manage Users button...")
-            self.driver.execute_script("arguments[0].scrollIntoView(true);", manage_users_button)
-            time.sleep(1)
-            manage_users_button.click()
-            time.sleep(3)
+            self.driver.execute_script(_CLICK_JS, manage_users_button)
+            
+            if not self._wait_for_student_list():
+                return False
             
             logger.info("✅ Successfully navigated back to student list")
             return True
@@ -1270,127 +1571,137 @@ class Step3ExtractData(AcelyAuthenticator):
         try:
             logger.info(f"🔍 Looking for student")
             
-            # Look for the student table rows
-            student_rows = self.driver.find_elements(By.XPATH, "//tr[contains(@class, 'border-b')]")
+            # Jump straight to dashboards already seen on the student list
+            hit = self._student_href_cache.get(target_email)
+            if hit:
+                hit = dict(hit, found=True, link=True)
+            else:
+                # Scan every student row in one round-trip
+                hit = self.driver.execute_script(_FIND_STUDENT_JS, target_email, list(_STUDENT_ROW_CSS), list(_NAME_LINK_CSS))
             
-            if not student_rows:
-                student_rows = self.driver.find_elements(By.XPATH, "//table//tr[position()>1]")
+            if not hit or not hit.get("found"):
+                logger.debug(f"Scanned {hit.get('rows', 0) if hit else 0} potential student rows")
+                logger.warning(f"⚠️ Student not found on current page")
+                return None
             
-            if not student_rows:
-                student_rows = self.driver.find_elements(By.XPATH, "//tr[contains(., '@')]")
+            logger.info(f"✅ Found target student")
             
-            logger.debug(f"Found {len(student_rows)} potential student rows")
+            if not hit.get("link"):
+                logger.warning(f"⚠️ Could not find name link for {target_email}")
+                return None
             
-            # Process each student row to find our target
-            for i, row in enumerate(student_rows):
-                try:
-                    # Look for email in this row
-                    email_elements = row.find_elements(By.XPATH, ".//td[contains(text(), '@')] | .//span[contains(text(), '@')] | .//*[contains(text(), '@')]")
-                    
-                    student_email = None
-                    for email_elem in email_elements:
-                        text = email_elem.text.strip()
-                        if '@' in text and '.' in text:  # Basic email validation
-                            student_email = text.lower()
-                            break
-                    
-                    if not student_email:
-                        continue
-                    
-                    # Check if this is our target student
-                    if student_email == target_email:
-                        logger.info(f"✅ Found target student")
-                        
-                        # Look for the name link in this row
-                        name_links = row.find_elements(By.XPATH, ".//a[contains(@class, 'link') and contains(@href, '/student-dashboard/')]")
-                        
-                        if not name_links:
-                            name_links = row.find_elements(By.XPATH, ".//a[contains(@href, '/student-dashboard/')]")
-                        
-                        if not name_links:
-                            name_links = row.find_elements(By.XPATH, ".//a[contains(@class, 'text-blue')]")
-                        
-                        if name_links:
-                            name_link = name_links[0]
-                            student_name = name_link.text.strip()
-                            
-                            logger.info(f"🎯 Found name link for student")
-                            
-                            # Click the student name link
-                            logger.info(f"🖱️ Clicking on student name...")
-                            self.driver.execute_script("arguments[0].scrollIntoView(true);", name_link)
-                            time.sleep(1)
-                            name_link.click()
-                            time.sleep(3)
-                            
-                            # Verify navigation to student dashboard
-                            current_url = self.driver.current_url
-                            if '/student-dashboard/' in current_url:
-                                logger.info(f"✅ Successfully navigated to student dashboard")
-                                
-                                # Extract data from the dashboard
-                                student_data = self.extract_student_data(student_email, student_name)
-                                return student_data
-                            else:
-                                logger.warning(f"⚠️ Unexpected URL after clicking {student_name}: {current_url}")
-                                return None
-                        else:
-                            logger.warning(f"⚠️ Could not find name link for {student_email}")
-                            return None
-                    
-                except Exception as e:
-                    logger.debug(f"Error processing row {i+1}: {e}")
-                    continue
+            student_name = hit.get("name")
+            logger.info(f"🎯 Found name link for student")
             
-            # Student not found on this page
-                logger.warning(f"⚠️ Student not found on current page")
-            return None
+            # Open the student dashboard, following the link directly when it has an href
+            logger.info(f"🖱️ Opening student dashboard...")
+            if hit.get("href"):
+                self.driver.get(hit["href"])
+            else:
+                name_link = hit["link"]
+                self.driver.execute_script(_CLICK_JS, name_link)
+            
+            # Verify navigation to student dashboard
+            try:
+                self.wait.until(EC.url_contains('/student-dashboard/'))
+            except TimeoutException:
+                pass
+            current_url = self.driver.current_url
+            if '/student-dashboard/' in current_url:
+                logger.info(f"✅ Successfully navigated to student dashboard")
+                
+                # With eager page loads the summary can render before the cards
+                # below it, which the section extractors read without waiting
+                self._await_dashboard_sections()
+                
+                # Extract data from the dashboard
+                student_data = self.extract_student_data(target_email, student_name)
+                return student_data
+            else:
+                logger.warning(f"⚠️ Unexpected URL after clicking {student_name}: {current_url}")
+                return None
             
         except Exception as e:
             logger.error(f"❌ Failed to find student: {e}")
             return None
-
+    
     def upload_individual_to_supabase(self, email, student_data):
-        """Upload individual student data to Supabase immediately after scraping"""
+        """Queue individual student data for upload, flushing once enough students are buffered"""
         try:
-            # Load environment variables
-            load_dotenv()
-            
-            # Check if Supabase credentials are available
-            supabase_url = os.getenv("SUPABASE_URL")
-            supabase_key = os.getenv("SUPABASE_ANON_KEY")
-            
-            if not supabase_url or not supabase_key:
-                logger.warning("⚠️ Supabase credentials not found. Skipping individual upload.")
-                return False
-            
-            # Import Supabase (only when needed)
-            try:
-                from supabase import create_client, Client
-            except ImportError:
-                logger.warning("⚠️ Supabase library not installed. Skipping individual upload.")
-                return False
-            
-            # Connect to Supabase
-            supabase: Client = create_client(supabase_url, supabase_key)
-            
-            # Transform and upload the student's data
-            transformed = self.transform_student_data(student_data)
-            
-            # Insert new row to Supabase
-            result = supabase.table("acely_students").insert(transformed).execute()
-            
-            if result.data:
-                logger.info(f"☁️ Uploaded to Supabase")
-                return True
-            else:
-                logger.warning(f"⚠️ No data returned from Supabase for {transformed['name']}")
-                return False
-                        
+            self._upload_buffer.append(self.transform_student_data(student_data))
         except Exception as e:
             logger.error(f"❌ Failed to upload individual data for {email}: {e}")
             return False
-
+        
+        if len(self._upload_buffer) >= _INDIVIDUAL_FLUSH_SIZE:
+            return self._submit_upload_buffer()
+        return True
+    
+    def _submit_upload_buffer(self):
+        """Hand the buffered records to a background upload thread so scraping can continue"""
+        if not self._upload_buffer:
+            return True
+        
+        # Build the client on this thread so upload threads never race to create it
+        supabase = self.get_supabase_client()
+        if supabase is None:
+            self._upload_buffer = []
+            return False
+        
+        if self._upload_pool is None:
+            self._upload_pool = ThreadPoolExecutor(max_workers=_UPLOAD_THREADS)
+        rows, self._upload_buffer = self._upload_buffer, []
+        self._upload_futures.append(self._upload_pool.submit(self._upload_rows, supabase, rows))
+        return True
+    
+    def flush_upload_buffer(self):
+        """Upload any buffered records and wait for all background uploads to finish"""
+        # Runs from finally blocks, so a failure here must not mask the original error
+        try:
+            submitted = self._submit_upload_buffer()
+        except Exception as e:
+            logger.error(f"❌ Failed to upload {len(self._upload_buffer)} buffered students: {e}")
+            self._upload_buffer = []
+            submitted = False
+        
+        futures, self._upload_futures = self._upload_futures, []
+        succeeded = all([future.result() for future in futures])
+        
+        if self._upload_pool is not None:
+            self._upload_pool.shutdown(wait=True)
+            self._upload_pool = None
+        return submitted and succeeded
+    
+    def _upload_rows(self, supabase, rows):
+        """Upload a group of student records to Supabase (runs on an upload thread)"""
+        try:
+            uploaded_count = self._insert_in_batches(supabase, rows)
+            logger.info(f"☁️ Uploaded {uploaded_count}/{len(rows)} buffered students to Supabase")
+            return uploaded_count == len(rows)
+                        
+        except Exception as e:
+            logger.error(f"❌ Failed to upload {len(rows)} buffered students: {e}")
+            return False
+    
+    def _insert_in_batches(self, supabase, rows):
+        """Insert rows into acely_students in bulk requests, returning how many were stored"""
+        uploaded_count = 0
+        rows_iter = iter(rows)
+        while True:
+            batch = list(islice(rows_iter, _UPLOAD_BATCH_SIZE))
+            if not batch:
+                break
+            try:
+                # Insert new rows to Supabase (always creates new records); with
+                # returning="minimal" the reply has no body, so success is no exception
+                supabase.table("acely_students").insert(batch, returning="minimal", count=None).execute()
+                uploaded_count += len(batch)
+                
+            except Exception as e:
+                logger.error(f"❌ Failed to upload batch of {len(batch)} students: {e}")
+                continue
+        return uploaded_count
+    
     def save_final_combined_data(self):
         """Save final combined data to JSON file"""
         try:
@@ -1406,8 +1717,14 @@ class Step3ExtractData(AcelyAuthenticator):
                 "not_found_emails": self.not_found_students
             }
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(final_data, f, indent=2, ensure_ascii=False)
+            # Compact output unless pretty_json is set; orjson serialises much faster when installed
+            if orjson is not None:
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(final_data, option=orjson.OPT_INDENT_2 if self.pretty_json else 0))
+            else:
+                with open(filename, 'w', encoding='utf-8') as f:
+                    json.dump(final_data, f, indent=2 if self.pretty_json else None, ensure_ascii=False,
+                              separators=None if self.pretty_json else (',', ':'))
             
             logger.info(f"💾 Saved final combined data to: {filename}")
             return filename
@@ -1416,8 +1733,77 @@ class Step3ExtractData(AcelyAuthenticator):
             logger.error(f"❌ Failed to save final combined data: {e}")
             return None
     
-    def scrape_all_students(self):
-        """Main method to scrape data from all target students"""
+    def open_student_list(self):
+        """Register the preload extractor and open Admin Console -> Manage Users"""
+        # Register the preload extractor before the next document loads
+        self.install_preload_extractor()
+        self.block_unused_resources()
+        
+        # Lookups below are explicit waits or in-page scripts; an implicit wait
+        # would only add its full timeout to every selector that misses
+        self.driver.implicitly_wait(0)
+        
+        # Navigate to admin console and click Manage Users
+        logger.info("📍 Navigating to Manage Users section...")
+        self.driver.get("https://app.acely.ai/team/admin-console")
+        
+        # Click Manage Users button once it is ready
+        manage_users_button = self._wait_for_clickable("manage_users", _MANAGE_USERS_XPATHS)
+        
+        if manage_users_button:
+            logger.info("🖱️ Clicking Manage Users button...")
+            self.driver.execute_script(_CLICK_JS, manage_users_button)
+            if self._wait_for_student_list():
+                self.cache_student_links()
+    
+    def cache_student_links(self):
+        """Remember the dashboard link of every student on the open list"""
+        try:
+            links = self.driver.execute_script(_STUDENT_LINKS_JS, list(_STUDENT_ROW_CSS), list(_NAME_LINK_CSS)) or {}
+        except Exception as e:
+            logger.debug(f"Could not read student links: {e}")
+            return
+        self._student_href_cache.update(links)
+        logger.info(f"🔗 Cached dashboard links for {len(links)} students")
+    
+    def scrape_emails(self, emails):
+        """Find and extract each of the given students from the open student list"""
+        on_student_list = True
+        for email_index, target_email in enumerate(emails):
+            logger.info(f"\n{'='*60}")
+            logger.info(f"📧 Processing student {email_index + 1}/{len(emails)}")
+            logger.info(f"{'='*60}")
+            
+            # Students without a cached dashboard link still have to be found on the list
+            if not on_student_list and target_email not in self._student_href_cache:
+                logger.info("🔄 Returning to student list...")
+                if not self.navigate_back_to_student_list():
+                    logger.error(f"❌ Failed to navigate back to student list before student {email_index + 1}")
+                    break
+                self.cache_student_links()
+            
+            # Find and extract data for this student
+            student_data = self.find_and_extract_student_data(target_email)
+            on_student_list = '/student-dashboard/' not in self.driver.current_url
+            
+            if student_data:
+                # Store the extracted data
+                self.student_data[target_email] = student_data
+                logger.info(f"✅ Data extracted for student {email_index + 1}")
+                
+                # Upload to Supabase immediately
+                self.upload_individual_to_supabase(target_email, student_data)
+            else:
+                logger.warning(f"⚠️ Student {email_index + 1} not found or data extraction failed")
+                self.not_found_students.append(target_email)
+    
+    def scrape_all_students(self, workers=1):
+        """Main method to scrape data from all target students
+        
+        With workers > 1 the target emails are split into contiguous shards. This
+        scraper handles the first shard while each remaining shard runs in its own
+        process with its own browser and login.
+        """
         try:
             # First, authenticate and navigate to manage users
             if not self.is_authenticated:
@@ -1426,34 +1812,7 @@ class Step3ExtractData(AcelyAuthenticator):
                     logger.error("❌ Authentication failed")
                     return False
             
-            # Navigate to admin console and click Manage Users
-            logger.info("📍 Navigating to Manage Users section...")
-            self.driver.get("https://app.acely.ai/team/admin-console")
-            time.sleep(5)
-            
-            # Click Manage Users button
-            manage_users_button = None
-            selectors = [
-                "//button[text()='Manage Users']",
-                "//button[contains(text(), 'Manage Users')]"
-            ]
-            
-            for selector in selectors:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, selector)
-                    for element in elements:
-                        if element.is_displayed() and element.is_enabled():
-                            manage_users_button = element
-                            break
-                    if manage_users_button:
-                        break
-                except:
-                    continue
-            
-            if manage_users_button:
-                logger.info("🖱️ Clicking Manage Users button...")
-                manage_users_button.click()
-                time.sleep(3)
+            self.open_student_list()
             
             # Load target emails
             if not self.load_target_emails():
@@ -1463,34 +1822,21 @@ class Step3ExtractData(AcelyAuthenticator):
                 logger.warning("⚠️ No target emails to search for")
                 return True
             
-            # Process each target email one by one
             logger.info(f"🚀 Starting to process {len(self.target_emails)} target students...")
             
-            for email_index, target_email in enumerate(self.target_emails):
-                logger.info(f"\n{'='*60}")
-                logger.info(f"📧 Processing student {email_index + 1}/{len(self.target_emails)}")
-                logger.info(f"{'='*60}")
-                
-                # Find and extract data for this student
-                student_data = self.find_and_extract_student_data(target_email)
-                
-                if student_data:
-                    # Store the extracted data
-                    self.student_data[target_email] = student_data
-                    logger.info(f"✅ Data extracted for student {email_index + 1}")
-                    
-                    # Upload to Supabase immediately
-                    self.upload_individual_to_supabase(target_email, student_data)
-                    
-                    # Navigate back to student list for the next student
-                    if email_index < len(self.target_emails) - 1:  # Don't navigate back after the last student
-                        logger.info("🔄 Preparing for next student...")
-                        if not self.navigate_back_to_student_list():
-                            logger.error(f"❌ Failed to navigate back to student list after student {email_index + 1}")
-                            break
-                else:
-                    logger.warning(f"⚠️ Student {email_index + 1} not found or data extraction failed")
-                    self.not_found_students.append(target_email)
+            shard_size = -(-len(self.target_emails) // max(1, workers))
+            shards = [self.target_emails[i:i + shard_size] for i in range(0, len(self.target_emails), shard_size)]
+            
+            if len(shards) > 1:
+                logger.info(f"🧵 Splitting students across {len(shards)} browsers")
+                with multiprocessing.Pool(len(shards) - 1) as pool:
+                    pending = pool.imap_unordered(_scrape_shard, [(self.config, shard) for shard in shards[1:]])
+                    self.scrape_emails(shards[0])
+                    for shard_data, shard_not_found in pending:
+                        self.student_data.update(shard_data)
+                        self.not_found_students.extend(shard_not_found)
+            else:
+                self.scrape_emails(self.target_emails)
             
             # Save final combined data to JSON file
             if self.student_data:
@@ -1516,36 +1862,22 @@ class Step3ExtractData(AcelyAuthenticator):
         except Exception as e:
             logger.error(f"❌ Failed to scrape students: {e}")
             return False
+        finally:
+            # Upload whatever is still buffered from the individual uploads, even
+            # when scraping stopped early
+            self.flush_upload_buffer()
+    
     
-
     
     def upload_to_supabase_direct(self):
         """Upload the scraped data directly to Supabase (no JSON file created)"""
         try:
             logger.info("🚀 Starting direct Supabase upload...")
             
-            # Load environment variables
-            load_dotenv()
-            
-            # Check if Supabase credentials are available
-            supabase_url = os.getenv("SUPABASE_URL")
-            supabase_key = os.getenv("SUPABASE_ANON_KEY")
-            
-            if not supabase_url or not supabase_key:
-                logger.warning("⚠️ Supabase credentials not found in .env file. Skipping upload.")
-                logger.info("💡 To enable automatic upload, add SUPABASE_URL and SUPABASE_ANON_KEY to your .env file")
-                return False
-            
-            # Import Supabase (only when needed)
-            try:
-                from supabase import create_client, Client
-            except ImportError:
-                logger.warning("⚠️ Supabase library not installed. Skipping upload.")
-                logger.info("💡 Install with: pip install supabase")
-                return False
-            
             # Connect to Supabase
-            supabase: Client = create_client(supabase_url, supabase_key)
+            supabase = self.get_supabase_client()
+            if supabase is None:
+                return False
             logger.info("✅ Connected to Supabase successfully")
             
             # Use in-memory student data (no JSON file)
@@ -1555,24 +1887,10 @@ class Step3ExtractData(AcelyAuthenticator):
             
             logger.info(f"👥 Found {len(self.student_data)} students to upload")
             
-            # Transform and upload each student's data
-            uploaded_count = 0
-            for email, student_data in self.student_data.items():
-                try:
-                    transformed = self.transform_student_data(student_data)
-                    
-                    # Insert new row to Supabase (always creates new records)
-                    result = supabase.table("acely_students").insert(transformed).execute()
-                    
-                    if result.data:
-                        logger.info(f"✅ Inserted new record for student")
-                        uploaded_count += 1
-                    else:
-                        logger.warning(f"⚠️ No data returned for {transformed['name']}")
-                        
-                except Exception as e:
-                    logger.error(f"❌ Failed to upload data for {email}: {e}")
-                    continue
+            # Transform every student, then upload in bulk inserts
+            scrape_timestamp = datetime.now().isoformat()
+            rows = [self.transform_student_data(student_data, scrape_timestamp) for student_data in self.student_data.values()]
+            uploaded_count = self._insert_in_batches(supabase, rows)
             
             logger.info(f"✅ Successfully uploaded {uploaded_count}/{len(self.student_data)} student records to Supabase")
             return uploaded_count > 0
@@ -1581,35 +1899,15 @@ class Step3ExtractData(AcelyAuthenticator):
             logger.error(f"❌ Supabase upload failed: {e}")
             return False
     
-    def transform_student_data(self, student_data):
+    def transform_student_data(self, student_data, scrape_timestamp=None):
         """Transform scraped student data to match the acely_students table structure"""
         try:
             # Extract data from the scraped structure
             extracted = student_data.get("data_extracted", {})
             
-            # Transform strongest/weakest areas
-            strongest_area = extracted.get("strongest_area", {})
-            weakest_area = extracted.get("weakest_area", {})
-            
             # Create the transformed record with scrape timestamp
-            transformed = {
-                "name": student_data.get("name"),
-                "email": student_data.get("email"),
-                "url": student_data.get("dashboard_url"),
-                "join_date": extracted.get("join_date"),
-                "most_recent_score": extracted.get("most_recent_score"),
-                "this_week_accuracy": extracted.get("this_week_accuracy"),
-                "last_week_accuracy": extracted.get("last_week_accuracy"),
-                "questions_answered_this_week": extracted.get("questions_answered_this_week"),
-                "questions_answered_last_week": extracted.get("questions_answered_last_week"),
-                "daily_activity": extracted.get("daily_activity_calendar"),
-                "strongest_area": strongest_area.get("area") if strongest_area else None,
-                "weakest_area": weakest_area.get("area") if weakest_area else None,
-                "strongest_area_accuracy": strongest_area.get("accuracy") if strongest_area else None,
-                "weakest_area_accuracy": weakest_area.get("accuracy") if weakest_area else None,
-                "mock_exam_results": extracted.get("mock_exam_results"),
-                "scrape_timestamp": datetime.now().isoformat(),
-            }
+            transformed = {dst: getter(student_data, extracted) for dst, getter in _FIELD_MAP}
+            transformed["scrape_timestamp"] = scrape_timestamp or datetime.now().isoformat()
             
             return transformed
             
@@ -1618,6 +1916,29 @@ class Step3ExtractData(AcelyAuthenticator):
             raise
 
 
+def _scrape_shard(args):
+    """Pool worker: log in with a fresh browser and scrape one shard of target emails"""
+    config, emails = args
+    scraper = Step3ExtractData(config)
+    try:
+        if not scraper.setup_driver() or not scraper.login():
+            logger.error(f"❌ Worker could not start a session, skipping {len(emails)} students")
+            return {}, list(emails)
+        
+        scraper.open_student_list()
+        scraper.scrape_emails(emails)
+        
+    except Exception as e:
+        logger.error(f"❌ Worker failed: {e}")
+    finally:
+        scraper.flush_upload_buffer()
+        scraper.close()
+    
+    # Anything neither scraped nor already reported counts as not found
+    not_found = [email for email in emails if email not in scraper.student_data]
+    return scraper.student_data, not_found
+
+
 def main():
     """Test the data extraction"""
     import os
@@ -1630,18 +1951,21 @@ def main():
         email=os.getenv("ACELY_EMAIL"),
         password=os.getenv("ACELY_PASSWORD"),
         headless=os.getenv("HEADLESS_MODE", "False").lower() == "true",  # Use visible mode for debugging
-        wait_timeout=int(os.getenv("WAIT_TIMEOUT", "10"))
+        wait_timeout=int(os.getenv("WAIT_TIMEOUT", "10")),
+        page_load_strategy="eager"  # Every step waits on the elements it needs
     )
+    workers = int(os.getenv("SCRAPER_WORKERS", "1"))
     
     # Create and run scraper
     scraper = Step3ExtractData(config)
+    scraper.pretty_json = os.getenv("PRETTY_JSON", "False").lower() == "true"
     
     try:
         # Setup the browser
         scraper.setup_driver()
         
         # Scrape all students
-        success = scraper.scrape_all_students()
+        success = scraper.scrape_all_students(workers=workers)
         
         if success:
             print("✅ Step 3 completed! Student data extraction finished")
@@ -4,18 +4,128 @@ Upload scraped student data to Supabase acely_students table.
 This script transforms the JSON output into the specific table structure.
 """
 
-import json
 import os
+import asyncio
+import operator
+import ijson
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from supabase import create_client, Client
+from itertools import islice
+from typing import Optional
+import httpx
+from supabase import create_client, Client, ClientOptions
 from dotenv import load_dotenv
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
+
+# Optional direct Postgres path for bulk loads, used when SUPABASE_DB_URL is set
+try:
+    import asyncpg
+except ImportError:
+    asyncpg = None
+
 # Load environment variables
 load_dotenv()
 
+# Rows per upsert request, kept well under PostgREST's payload limit
+UPSERT_BATCH_SIZE = 500
+
+# Students handed to each transform worker at a time
+TRANSFORM_CHUNK_SIZE = 64
+
+# One client per process; its HTTP pool keeps connections alive between upserts
+_client: Optional[Client] = None
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=10, max_connections=20, keepalive_expiry=30)
+
+# acely_students column -> key in the scraped student record
+_STUDENT_FIELDS = (
+    ("name", "name"),
+    ("email", "email"),
+    ("url", "dashboard_url"),
+)
+
+# acely_students column -> key in the record's data_extracted section
+_EXTRACTED_FIELDS = (
+    ("join_date", "join_date"),
+    ("most_recent_score", "most_recent_score"),
+    ("this_week_accuracy", "this_week_accuracy"),
+    ("last_week_accuracy", "last_week_accuracy"),
+    ("questions_answered_this_week", "questions_answered_this_week"),
+    ("questions_answered_last_week", "questions_answered_last_week"),
+    ("daily_activity", "daily_activity_calendar"),
+    ("mock_exam_results", "mock_exam_results"),
+)
+
+# Fetch every data_extracted value in one C-level call; rows missing a key
+# fall back to per-key dict.get in transform_student_data
+_EXTRACTED_COLUMNS = tuple(column for column, _ in _EXTRACTED_FIELDS)
+_get_extracted = operator.itemgetter(*(key for _, key in _EXTRACTED_FIELDS))
+
+# acely_students column -> Postgres type, in the order the direct upsert binds them
+_UPSERT_COLUMNS = (
+    ("name", "text"),
+    ("email", "text"),
+    ("url", "text"),
+    ("join_date", "text"),
+    ("most_recent_score", "integer"),
+    ("this_week_accuracy", "text"),
+    ("last_week_accuracy", "text"),
+    ("questions_answered_this_week", "integer"),
+    ("questions_answered_last_week", "integer"),
+    ("daily_activity", "jsonb"),
+    ("strongest_area", "text"),
+    ("weakest_area", "text"),
+    ("strongest_area_accuracy", "text"),
+    ("weakest_area_accuracy", "text"),
+    ("mock_exam_results", "jsonb"),
+)
+
+# Values are bound as text and cast server-side, the same coercion PostgREST applies to JSON input
+_UPSERT_SQL = "INSERT INTO acely_students ({}) VALUES ({}) ON CONFLICT (email) DO UPDATE SET {}".format(
+    ", ".join(column for column, _ in _UPSERT_COLUMNS),
+    ", ".join(
+        f"${i}::text" if pg_type == "text" else f"${i}::text::{pg_type}"
+        for i, (_, pg_type) in enumerate(_UPSERT_COLUMNS, 1)
+    ),
+    ", ".join(f"{column} = EXCLUDED.{column}" for column, _ in _UPSERT_COLUMNS if column != "email"),
+)
+
+# Prefer ijson's C (yajl2) parser when it is installed
+try:
+    ijson = ijson.get_backend("yajl2_c")
+except ImportError:
+    pass
+
+def _http_client() -> httpx.Client:
+    """Keep-alive HTTP client, multiplexing requests over HTTP/2 when h2 is installed."""
+    try:
+        return httpx.Client(http2=True, limits=_HTTP_LIMITS, timeout=30)
+    except ImportError:
+        logger.warning("⚠️ h2 is not installed, talking to Supabase over HTTP/1.1")
+        return httpx.Client(limits=_HTTP_LIMITS, timeout=30)
+
+def _client_options() -> ClientOptions:
+    """Client options with a keep-alive HTTP pool, where the installed supabase supports one."""
+    try:
+        return ClientOptions(
+            postgrest_client_timeout=30,
+            httpx_client=_http_client()
+        )
+    except TypeError:
+        # Older supabase releases don't accept a custom httpx client
+        return ClientOptions(postgrest_client_timeout=30)
+
 def connect_to_supabase() -> Client:
-    """Connect to Supabase using environment variables."""
+    """Connect to Supabase using environment variables, reusing the existing client."""
+    global _client
+    if _client is not None:
+        return _client
+    
     try:
         url = os.getenv("SUPABASE_URL")
         key = os.getenv("SUPABASE_ANON_KEY")
@@ -23,72 +133,118 @@ def connect_to_supabase() -> Client:
         if not url or not key:
             raise ValueError("Missing SUPABASE_URL or SUPABASE_ANON_KEY in environment variables")
         
-        supabase: Client = create_client(url, key)
+        _client = create_client(url, key, options=_client_options())
         logger.info("✅ Connected to Supabase successfully")
-        return supabase
+        return _client
         
     except Exception as e:
         logger.error(f"❌ Failed to connect to Supabase: {e}")
         raise
 
+def _build_fast_transform():
+    """Compile a straight-line transform from the field tables, with every key written out literally."""
+    lines = [
+        "def _fast_transform(s):",
+        "    e = s.get('data_extracted') or {}",
+        "    sa = e.get('strongest_area') or {}",
+        "    wa = e.get('weakest_area') or {}",
+        "    return {",
+    ]
+    lines += [f"        {column!r}: s.get({key!r})," for column, key in _STUDENT_FIELDS]
+    lines += [f"        {column!r}: e.get({key!r})," for column, key in _EXTRACTED_FIELDS]
+    lines += [
+        "        'strongest_area': sa.get('area'),",
+        "        'weakest_area': wa.get('area'),",
+        "        'strongest_area_accuracy': sa.get('accuracy'),",
+        "        'weakest_area_accuracy': wa.get('accuracy'),",
+        "    }",
+    ]
+    namespace = {}
+    exec(compile("\n".join(lines), "<transform_student_data>", "exec"), namespace)
+    return namespace["_fast_transform"]
+
+_fast_transform = _build_fast_transform()
+
 def transform_student_data(student_data: dict) -> dict:
     """Transform scraped student data to match the acely_students table structure."""
+    try:
+        transformed = _fast_transform(student_data)
+    except Exception:
+        # Malformed records go through the general path, which logs what failed
+        return _transform_student_data_safe(student_data)
+    
+    logger.opt(lazy=True).debug(
+        "Transformed data for {}: {} characters",
+        lambda: transformed['name'], lambda: len(str(transformed))
+    )
+    return transformed
+
+def _transform_student_data_safe(student_data: dict) -> dict:
+    """Transform scraped student data field by field, logging and re-raising on failure."""
     try:
         # Extract data from the scraped structure
         extracted = student_data.get("data_extracted", {})
         
+        # Create the transformed record
+        transformed = {column: student_data.get(key) for column, key in _STUDENT_FIELDS}
+        try:
+            transformed.update(zip(_EXTRACTED_COLUMNS, _get_extracted(extracted)))
+        except KeyError:
+            transformed.update({column: extracted.get(key) for column, key in _EXTRACTED_FIELDS})
+        
         # Transform strongest/weakest areas
-        strongest_area = extracted.get("strongest_area", {})
-        weakest_area = extracted.get("weakest_area", {})
+        strongest_get = (extracted.get("strongest_area") or {}).get
+        weakest_get = (extracted.get("weakest_area") or {}).get
+        transformed["strongest_area"] = strongest_get("area")
+        transformed["weakest_area"] = weakest_get("area")
+        transformed["strongest_area_accuracy"] = strongest_get("accuracy")
+        transformed["weakest_area_accuracy"] = weakest_get("accuracy")
         
-        # Create the transformed record
-        transformed = {
-            "name": student_data.get("name"),
-            "email": student_data.get("email"),
-            "url": student_data.get("dashboard_url"),
-            "join_date": extracted.get("join_date"),
-            "most_recent_score": extracted.get("most_recent_score"),
-            "this_week_accuracy": extracted.get("this_week_accuracy"),
-            "last_week_accuracy": extracted.get("last_week_accuracy"),
-            "questions_answered_this_week": extracted.get("questions_answered_this_week"),
-            "questions_answered_last_week": extracted.get("questions_answered_last_week"),
-            "daily_activity": extracted.get("daily_activity_calendar"),
-            "strongest_area": strongest_area.get("area") if strongest_area else None,
-            "weakest_area": weakest_area.get("area") if weakest_area else None,
-            "strongest_area_accuracy": strongest_area.get("accuracy") if strongest_area else None,
-            "weakest_area_accuracy": weakest_area.get("accuracy") if weakest_area else None,
-            "mock_exam_results": extracted.get("mock_exam_results"),
-        }
-        
-        logger.debug(f"Transformed data for {transformed['name']}: {len(str(transformed))} characters")
+        logger.opt(lazy=True).debug(
+            "Transformed data for {}: {} characters",
+            lambda: transformed['name'], lambda: len(str(transformed))
+        )
         return transformed
         
     except Exception as e:
         logger.error(f"❌ Failed to transform student data: {e}")
         raise
 
+def _upsert(supabase: Client, records: list):
+    """Upsert records by email without asking PostgREST to send the rows back.
+
+    The response carries no rows, so callers that need to find a stored
+    record again should look it up by its email rather than a returned id.
+    """
+    return supabase.table("acely_students").upsert(
+        records,
+        on_conflict="email",  # Use email as the conflict resolution column
+        returning="minimal",
+        count=None
+    ).execute()
+
 def upload_student_data(supabase: Client, student_records: list) -> int:
-    """Upload student records to Supabase, handling upserts by email."""
+    """Upload student records to Supabase in batched upserts keyed by email."""
     try:
         uploaded_count = 0
         
-        for record in student_records:
+        for start in range(0, len(student_records), UPSERT_BATCH_SIZE):
+            batch = student_records[start:start + UPSERT_BATCH_SIZE]
             try:
-                # Try to upsert (insert or update if email exists)
-                result = supabase.table("acely_students").upsert(
-                    record,
-                    on_conflict="email"  # Use email as the conflict resolution column
-                ).execute()
+                _upsert(supabase, batch)
+                uploaded_count += len(batch)
+                logger.info(f"✅ Uploaded/updated {len(batch)} students")
                 
-                if result.data:
-                    logger.info(f"✅ Uploaded/updated data for student")
-                    uploaded_count += 1
-                else:
-                    logger.warning(f"⚠️ No data returned for {record['name']}")
-                    
             except Exception as e:
-                logger.error(f"❌ Failed to upload data for {record.get('name', 'Unknown')}: {e}")
-                continue
+                # Retry this batch row by row so one bad record doesn't drop the rest
+                logger.warning(f"⚠️ Batch upsert of {len(batch)} students failed, retrying individually: {e}")
+                for record in batch:
+                    try:
+                        _upsert(supabase, record)
+                        uploaded_count += 1
+                    except Exception as e:
+                        logger.error(f"❌ Failed to upload data for {record.get('name', 'Unknown')}: {e}")
+                        continue
         
         return uploaded_count
         
@@ -96,20 +252,67 @@ def upload_student_data(supabase: Client, student_records: list) -> int:
         logger.error(f"❌ Failed to upload student data: {e}")
         raise
 
+def _to_db_text(value):
+    """Render a transformed value as the text parameter _UPSERT_SQL casts."""
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (dict, list)):
+        return orjson.dumps(value).decode() if orjson else json.dumps(value)
+    if isinstance(value, float) and value.is_integer():
+        # Whole floats would otherwise fail the ::integer casts as "1450.0"
+        return str(int(value))
+    return str(value)
+
+async def upload_student_data_direct(pool, student_records: list) -> int:
+    """Upsert student records over a direct Postgres connection in one executemany."""
+    rows = [
+        tuple(_to_db_text(record.get(column)) for column, _ in _UPSERT_COLUMNS)
+        for record in student_records
+    ]
+    async with pool.acquire() as conn:
+        await conn.executemany(_UPSERT_SQL, rows)
+    logger.info(f"✅ Uploaded/updated {len(rows)} students over Postgres")
+    return len(rows)
+
+async def _upload_batches_direct(db_url: str, supabase: Client, batches) -> tuple:
+    """Upsert each batch over asyncpg, falling back to PostgREST for batches that fail."""
+    uploaded_count = 0
+    transformed_count = 0
+    
+    # statement_cache_size=0 keeps this working through Supavisor's transaction-mode pooler
+    async with asyncpg.create_pool(
+        db_url,
+        min_size=2,
+        max_size=10,
+        timeout=30,
+        max_inactive_connection_lifetime=1800,
+        statement_cache_size=0
+    ) as pool:
+        for batch in batches:
+            transformed_count += len(batch)
+            try:
+                uploaded_count += await upload_student_data_direct(pool, batch)
+            except Exception as e:
+                logger.warning(f"⚠️ Postgres upsert of {len(batch)} students failed, retrying through PostgREST: {e}")
+                uploaded_count += upload_student_data(supabase, batch)
+    
+    return uploaded_count, transformed_count
+
 def load_latest_json_file() -> str:
     """Find and return the path to the most recent student_data_*.json file."""
     try:
-        import glob
-        
-        # Look for student_data_*.json files
-        pattern = "student_data_*.json"
-        files = glob.glob(pattern)
+        # Names carry a sortable %Y%m%d_%H%M%S timestamp, so the latest file is
+        # the lexicographically largest name and no stat() calls are needed
+        latest_file = None
+        with os.scandir(".") as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith("student_data_") and name.endswith(".json") and (latest_file is None or name > latest_file):
+                    latest_file = name
         
-        if not files:
+        if latest_file is None:
             raise FileNotFoundError("No student_data_*.json files found")
         
-        # Sort by modification time and get the latest
-        latest_file = max(files, key=os.path.getmtime)
         logger.info(f"📄 Found latest data file: {latest_file}")
         return latest_file
         
@@ -117,6 +320,50 @@ def load_latest_json_file() -> str:
         logger.error(f"❌ Failed to find latest JSON file: {e}")
         raise
 
+def _transform_or_none(student_data: dict) -> Optional[dict]:
+    """Transform one student, logging and returning None instead of raising so pool.map keeps going."""
+    try:
+        return transform_student_data(student_data)
+    except Exception as e:
+        logger.error(f"❌ Failed to transform data for student: {e}")
+        return None
+
+def _transformed_batches(json_file_path: str, counts: dict, workers: int):
+    """Stream students out of the file, yielding transformed records UPSERT_BATCH_SIZE at a time.
+    
+    With more than one worker the transforms run in a process pool, and the next
+    batch is submitted before the current one is yielded so it transforms while
+    the caller uploads.
+    """
+    with open(json_file_path, 'rb') as f:
+        students = (student_data for email, student_data in ijson.kvitems(f, "students", use_float=True))
+        
+        if workers <= 1:
+            while True:
+                raw = list(islice(students, UPSERT_BATCH_SIZE))
+                if not raw:
+                    return
+                counts["students"] += len(raw)
+                batch = [record for record in map(_transform_or_none, raw) if record is not None]
+                if batch:
+                    yield batch
+        
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = None
+            while True:
+                raw = list(islice(students, UPSERT_BATCH_SIZE))
+                counts["students"] += len(raw)
+                submitted = pool.map(_transform_or_none, raw, chunksize=TRANSFORM_CHUNK_SIZE) if raw else None
+                
+                if pending is not None:
+                    batch = [record for record in pending if record is not None]
+                    if batch:
+                        yield batch
+                
+                if submitted is None:
+                    return
+                pending = submitted
+
 def main():
     """Main function to upload student data to Supabase."""
     try:
@@ -128,41 +375,42 @@ def main():
         # Find and load the latest JSON file
         json_file_path = load_latest_json_file()
         
-        with open(json_file_path, 'r') as f:
-            data = json.load(f)
+        logger.info(f"📊 Streaming data from {json_file_path}")
+        
+        # Stream students out of the file and upload them one batch at a time
+        counts = {"students": 0}
+        # The transform is cheap next to pickling whole records across processes,
+        # so the pool is opt-in
+        workers = int(os.getenv("TRANSFORM_WORKERS", "1"))
+        batches = _transformed_batches(json_file_path, counts, workers)
         
-        logger.info(f"📊 Loaded data from {json_file_path}")
+        db_url = os.getenv("SUPABASE_DB_URL")
+        if db_url and asyncpg is not None:
+            logger.info("🐘 Upserting directly over Postgres")
+            uploaded_count, transformed_count = asyncio.run(_upload_batches_direct(db_url, supabase, batches))
+        else:
+            if db_url:
+                logger.warning("⚠️ SUPABASE_DB_URL is set but asyncpg is not installed, uploading through PostgREST")
+            uploaded_count = 0
+            transformed_count = 0
+            for batch in batches:
+                uploaded_count += upload_student_data(supabase, batch)
+                transformed_count += len(batch)
         
-        # Extract student data
-        students_data = data.get("students", {})
+        student_count = counts["students"]
         
-        if not students_data:
+        if not student_count:
             logger.warning("⚠️ No student data found in JSON file")
             return
         
-        logger.info(f"👥 Found {len(students_data)} students to upload")
-        
-        # Transform each student's data
-        transformed_records = []
-        for email, student_data in students_data.items():
-            try:
-                transformed = transform_student_data(student_data)
-                transformed_records.append(transformed)
-            except Exception as e:
-                logger.error(f"❌ Failed to transform data for student: {e}")
-                continue
-        
-        if not transformed_records:
+        if not transformed_count:
             logger.error("❌ No valid student records to upload")
             return
         
-        # Upload to Supabase
-        uploaded_count = upload_student_data(supabase, transformed_records)
-        
-        logger.info(f"✅ Successfully uploaded {uploaded_count}/{len(transformed_records)} student records")
+        logger.info(f"✅ Successfully uploaded {uploaded_count}/{transformed_count} student records")
         
         # Summary
-        logger.info(f"📋 Upload Summary: {len(transformed_records)} students processed")
+        logger.info(f"📋 Upload Summary: {transformed_count} students processed")
         
     except Exception as e:
         logger.error(f"❌ Upload process failed: {e}")
@@ -3,23 +3,183 @@
 Collect data for the 3 students we found on the dashboard
 """
 
-import time
 import os
-from selenium import webdriver
+import base64
+import gzip
+import multiprocessing
+import multiprocessing.util
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-import json
+from selenium.common.exceptions import TimeoutException, WebDriverException
+import orjson
 from datetime import datetime
 from dotenv import load_dotenv
+from session import driver_path, start_chrome
+from config import SCRAPER_CONFIG
 
 load_dotenv()
 
+ADMIN_URL = "https://app.alphamath.school/admin"
+MAX_BROWSERS = 4
+
+# Summarise the student page: the first 2000 characters of its text (when
+# arguments[0] is true), the number of tables, and the elements whose own text
+# mentions progress or score (count plus the first five texts). Chart labels sit
+# in SVG <text>, which has no innerText, so those fall back to textContent
+_PAGE_SUMMARY_JS = """
+const out = {tables: document.querySelectorAll('table').length, progress: [], progress_count: 0};
+if (arguments[0]) {
+    const text = document.body.innerText;
+    out.text = text.slice(0, 2000);
+    out.text_length = text.length;
+}
+const re = /progress|score/i;
+const seen = new Set();
+const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+let node;
+while ((node = walker.nextNode())) {
+    const el = node.parentElement;
+    if (!el || seen.has(el) || !re.test(node.nodeValue)) continue;
+    seen.add(el);
+    out.progress_count++;
+    if (out.progress.length < 5) out.progress.push((el.innerText ?? el.textContent ?? '').trim());
+}
+return out;
+"""
+
+# Find the table row mentioning the student, scroll to it and click the name link
+# in its first cell (or the cell, or the row). Otherwise report the last row so
+# the caller can wait for lazily rendered rows to replace it
+_FIND_AND_CLICK_STUDENT_JS = """
+const name = arguments[0];
+const rows = document.querySelectorAll('table tr');
+for (const tr of rows) {
+    if (!tr.innerText.toLowerCase().includes(name)) continue;
+    tr.scrollIntoView({block: 'center'});
+    const clickable = tr.querySelector('td:first-child a') || tr.querySelector('td:first-child') || tr;
+    clickable.click();
+    return {clicked: true};
+}
+return {clicked: false, last_row: rows.length ? rows[rows.length - 1] : null};
+"""
+
+# Each pool worker process drives its own browser, quit by the finalizer when
+# the worker exits
+_driver = None
+_driver_finalizer = None
+
+def _create_driver():
+    """Start a Chrome instance using the driver binary cached by the parent process"""
+    chrome_options = Options()
+    chrome_options.add_argument("--window-size=1400,1000")
+    if os.getenv("HEADLESS_MODE", str(SCRAPER_CONFIG["headless"])).lower() == "true":
+        chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    # Images are never scraped, so skip downloading and decoding them
+    chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    # driver.get returns at DOMContentLoaded; every step waits for what it needs
+    chrome_options.page_load_strategy = "eager"
+    return start_chrome(chrome_options)
+
+def _login(driver):
+    """Open the admin dashboard, logging in if needed, and wait for the student table"""
+    driver.get(ADMIN_URL)
+    
+    # Wait until either the login form or the dashboard table has rendered
+    WebDriverWait(driver, 15).until(EC.any_of(
+        EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='password']")),
+        EC.presence_of_element_located((By.TAG_NAME, "table"))
+    ))
+    
+    # Login if needed
+    if "login" in driver.page_source.lower():
+        username = os.getenv('USERNAME')
+        password = os.getenv('PASSWORD')
+        
+        username_field = driver.find_element(By.CSS_SELECTOR, "input[type='email'], input[name='email']")
+        password_field = driver.find_element(By.CSS_SELECTOR, "input[type='password']")
+        
+        username_field.send_keys(username)
+        password_field.send_keys(password)
+        password_field.send_keys("\n")
+    
+    # Wait for dashboard
+    WebDriverWait(driver, 15).until(
+        EC.presence_of_element_located((By.TAG_NAME, "table"))
+    )
+
+def _worker_driver():
+    """Return this worker process's logged-in browser, starting it on first use"""
+    global _driver, _driver_finalizer
+    if _driver is None:
+        driver = _create_driver()
+        try:
+            _login(driver)
+        except Exception:
+            driver.quit()
+            raise
+        _driver = driver
+        _driver_finalizer = multiprocessing.util.Finalize(None, driver.quit, exitpriority=10)
+        print("✅ Logged in successfully")
+    return _driver
+
+def _collect_one(student_name):
+    """Pool worker: find, click and scrape one student, then return to the dashboard"""
+    global _driver
+    print(f"\n{'='*50}")
+    print(f"📚 Processing student")
+    print(f"{'='*50}")
+    
+    # Log in here rather than in a pool initializer: an initializer that raises
+    # makes the pool respawn the worker (and its browser) forever
+    try:
+        driver = _worker_driver()
+    except Exception as e:
+        print(f"❌ Login failed: {str(e)}")
+        return student_name, {
+            'name': student_name,
+            'status': 'login_failed',
+            'error': str(e),
+            'timestamp': datetime.now().isoformat()
+        }
+    
+    # Find and click the student
+    if not find_and_click_student(driver, student_name):
+        return student_name, {
+            'name': student_name,
+            'status': 'not_clickable',
+            'timestamp': datetime.now().isoformat()
+        }
+    
+    # Collect data from student page
+    data = scrape_student_page(driver, student_name)
+    
+    # Go back to dashboard
+    print("🔙 Returning to dashboard...")
+    student_url = driver.current_url
+    driver.back()
+    
+    # Wait for table to reload; a slow reload shouldn't lose the data already collected
+    try:
+        wait = WebDriverWait(driver, 10)
+        wait.until(EC.url_changes(student_url))
+        wait.until(EC.presence_of_element_located((By.TAG_NAME, "table")))
+    except Exception as e:
+        print(f"⚠️ Dashboard did not reload, logging in again: {str(e)}")
+        try:
+            _login(driver)
+        except Exception as e:
+            # Start a fresh browser for this worker's next student
+            print(f"❌ Login failed: {str(e)}")
+            _driver_finalizer()
+            _driver = None
+    return student_name, data
+
 def collect_student_data():
-    driver = None
     try:
         # The 3 students we found
         found_students = ["Ananya Peesu", "Geetesh Parelly", "Sloka Vudumu"]
@@ -27,71 +187,24 @@ def collect_student_data():
         print("🚀 Starting data collection for found students")
         print(f"📚 Students to process: {len(found_students)} students")
         
-        # Setup browser
-        chrome_options = Options()
-        chrome_options.add_argument("--window-size=1400,1000")
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-        
-        # Login and navigate
-        print("🔑 Logging in...")
-        driver.get("https://app.alphamath.school/admin")
-        time.sleep(3)
-        
-        # Login if needed
-        if "login" in driver.page_source.lower():
-            username = os.getenv('USERNAME')
-            password = os.getenv('PASSWORD')
-            
-            username_field = driver.find_element(By.CSS_SELECTOR, "input[type='email'], input[name='email']")
-            password_field = driver.find_element(By.CSS_SELECTOR, "input[type='password']")
-            
-            username_field.send_keys(username)
-            password_field.send_keys(password)
-            password_field.send_keys("\n")
-            
-            time.sleep(5)
-        
-        print("✅ Logged in successfully")
-        
-        # Wait for dashboard
-        WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located((By.TAG_NAME, "table"))
-        )
+        # Resolve the driver binary once; workers pick it up from the on-disk cache
+        driver_path()
         
-        student_data = {}
-        
-        # Process each student
-        for i, student_name in enumerate(found_students, 1):
-            print(f"\n{'='*50}")
-            print(f"📚 Processing student {i}/{len(found_students)}")
-            print(f"{'='*50}")
-            
-            # Find and click the student
-            if find_and_click_student(driver, student_name):
-                # Collect data from student page
-                data = scrape_student_page(driver, student_name)
-                student_data[student_name] = data
-                
-                # Go back to dashboard
-                print("🔙 Returning to dashboard...")
-                driver.back()
-                time.sleep(3)
-                
-                # Wait for table to reload
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "table"))
-                )
-            else:
-                student_data[student_name] = {
-                    'name': student_name,
-                    'status': 'not_clickable',
-                    'timestamp': datetime.now().isoformat()
-                }
+        # Each worker logs in with its own browser and takes students as it frees up
+        browsers = min(len(found_students), MAX_BROWSERS)
+        print(f"🔑 Logging in with {browsers} browsers...")
+        pool = multiprocessing.Pool(processes=browsers)
+        try:
+            student_data = dict(pool.map(_collect_one, found_students))
+        finally:
+            # close + join (not terminate) so each worker's browser is quit cleanly
+            pool.close()
+            pool.join()
         
         # Save results
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"found_students_data_{timestamp}.json"
+        filename = f"found_students_data_{timestamp}.json.gz"
+        lines_filename = f"found_students_data_{timestamp}.jsonl.gz"
         
         final_results = {
             'collection_timestamp': datetime.now().isoformat(),
@@ -100,26 +213,24 @@ def collect_student_data():
             'student_data': student_data
         }
         
-        with open(filename, 'w') as f:
-            json.dump(final_results, f, indent=2)
+        # Level 1 compression is cheap and shrinks the page text considerably
+        with gzip.open(filename, 'wb', compresslevel=1) as f:
+            f.write(orjson.dumps(final_results, option=orjson.OPT_INDENT_2))
+        
+        # One student per line, so readers can stream records without parsing the whole file
+        with gzip.open(lines_filename, 'wb', compresslevel=1) as f:
+            for data in student_data.values():
+                f.write(orjson.dumps(data))
+                f.write(b"\n")
         
         print(f"\n🎉 Data collection complete!")
         print(f"📊 Summary:")
         print(f"   - Students processed: {final_results['students_processed']}")
         print(f"   - Successful collections: {final_results['successful_collections']}")
-        print(f"💾 Results saved to: {filename}")
-        
-        # Keep browser open briefly
-        print(f"\n👀 Browser will close in 10 seconds...")
-        for i in range(10, 0, -1):
-            print(f"   ⏰ {i}...", end='\r')
-            time.sleep(1)
+        print(f"💾 Results saved to: {filename} (per-student lines: {lines_filename})")
         
     except Exception as e:
         print(f"❌ Error: {str(e)}")
-    finally:
-        if driver:
-            driver.quit()
 
 def find_and_click_student(driver, student_name):
     """Find and click on a specific student"""
@@ -128,50 +239,39 @@ def find_and_click_student(driver, student_name):
         
         # Scroll to top first
         driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(1)
+        
+        current_url = driver.current_url
+        lname = student_name.lower()
         
         # Search through the page
         max_scrolls = 30
         for scroll in range(max_scrolls):
-            # Check current visible rows
-            rows = driver.find_elements(By.XPATH, "//table//tr")
+            # Check current visible rows in one round-trip; clicks the row on a match
+            result = driver.execute_script(_FIND_AND_CLICK_STUDENT_JS, lname)
             
-            for row in rows:
-                try:
-                    row_text = row.text.strip()
-                    if student_name.lower() in row_text.lower():
-                        print(f"✅ Found target student in table!")
-                        
-                        # Scroll row into view
-                        driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", row)
-                        time.sleep(2)
-                        
-                        # Try to find clickable element
-                        try:
-                            # Look for clickable name in first cell
-                            clickable = row.find_element(By.XPATH, ".//td[1]//a")
-                        except:
-                            try:
-                                # Try the first cell itself
-                                clickable = row.find_element(By.XPATH, ".//td[1]")
-                            except:
-                                clickable = row
-                        
-                        print(f"🖱️  Clicking on student...")
-                        driver.execute_script("arguments[0].click();", clickable)
-                        time.sleep(5)  # Wait for page to load
-                        
-                        print(f"✅ Successfully clicked student")
-                        return True
-                        
-                except:
-                    continue
+            if result.get('clicked'):
+                print(f"✅ Found target student in table!")
+                print(f"🖱️  Clicking on student...")
+                
+                # Wait for the student page to load
+                wait = WebDriverWait(driver, 15)
+                wait.until(EC.url_changes(current_url))
+                wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+                
+                print(f"✅ Successfully clicked student")
+                return True
             
             # Scroll down and continue searching
             driver.execute_script("window.scrollBy(0, 300);")
-            time.sleep(1)
+            
+            # Give lazily rendered rows up to a second to replace the ones just scanned
+            if result.get('last_row'):
+                try:
+                    WebDriverWait(driver, 1).until(EC.staleness_of(result['last_row']))
+                except TimeoutException:
+                    pass
         
-            print(f"❌ Could not find clickable element for student")
+        print(f"❌ Could not find clickable element for student")
         return False
         
     except Exception as e:
@@ -184,7 +284,9 @@ def scrape_student_page(driver, student_name):
         print(f"📊 Collecting data for student...")
         
         # Wait for page to load
-        time.sleep(3)
+        WebDriverWait(driver, 10).until(
+            lambda d: d.execute_script("return document.readyState") != "loading"
+        )
         
         data = {
             'name': student_name,
@@ -197,41 +299,37 @@ def scrape_student_page(driver, student_name):
         print(f"   📄 Page: {data['title']}")
         print(f"   🔗 URL: {data['url']}")
         
-        # Get page text
+        # Page text, table count and progress indicators in a single round-trip
         try:
-            body_text = driver.find_element(By.TAG_NAME, "body").text
-            data['page_text'] = body_text[:2000]  # First 2000 characters
-            print(f"   📝 Collected page text ({len(body_text)} characters)")
-        except:
-            pass
+            summary = driver.execute_script(_PAGE_SUMMARY_JS, SCRAPER_CONFIG["collect_body_text"])
+        except WebDriverException as e:
+            print(f"   ⚠️  Could not read page summary: {e.msg}")
+            summary = {}
+        
+        if summary.get('text') is not None:
+            data['page_text'] = summary['text']  # First 2000 characters
+            print(f"   📝 Collected page text ({summary['text_length']} characters)")
         
         # Look for specific data elements
-        try:
-            # Check for tables
-            tables = driver.find_elements(By.TAG_NAME, "table")
-            if tables:
-                data['tables_found'] = len(tables)
-                print(f"   📋 Found {len(tables)} tables")
-        except:
-            pass
+        if summary.get('tables'):
+            data['tables_found'] = summary['tables']
+            print(f"   📋 Found {summary['tables']} tables")
         
-        try:
-            # Check for progress indicators
-            progress_elements = driver.find_elements(By.XPATH, "//*[contains(text(), 'progress') or contains(text(), 'Progress') or contains(text(), 'score') or contains(text(), 'Score')]")
-            if progress_elements:
-                data['progress_indicators'] = [elem.text.strip() for elem in progress_elements[:5]]
-                print(f"   📈 Found {len(progress_elements)} progress indicators")
-        except:
-            pass
-        
-        # Take screenshot
-        try:
-            screenshot_name = f"{student_name.replace(' ', '_')}_screenshot_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-            driver.save_screenshot(screenshot_name)
-            data['screenshot'] = screenshot_name
-            print(f"   📸 Screenshot saved: {screenshot_name}")
-        except:
-            pass
+        if summary.get('progress_count'):
+            data['progress_indicators'] = summary['progress']
+            print(f"   📈 Found {summary['progress_count']} progress indicators")
+        
+        # Take screenshot straight from DevTools
+        if SCRAPER_CONFIG["collect_screenshot"]:
+            try:
+                screenshot_name = f"{student_name.replace(' ', '_')}_screenshot_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
+                shot = driver.execute_cdp_cmd("Page.captureScreenshot", {"format": "png", "captureBeyondViewport": False})
+                with open(screenshot_name, 'wb') as f:
+                    f.write(base64.b64decode(shot["data"]))
+                data['screenshot'] = screenshot_name
+                print(f"   📸 Screenshot saved: {screenshot_name}")
+            except (WebDriverException, OSError) as e:
+                print(f"   ⚠️  Could not save screenshot: {e}")
         
         print(f"✅ Data collection complete for student")
         return data
@@ -9,7 +9,9 @@ TARGET_URL = "https://app.alphamath.school/admin/downloads"
 SCRAPER_CONFIG = {
     "headless": False,  # Set to True to run browser in headless mode
     "timeout": 30,      # Timeout in seconds for web elements
-    "implicit_wait": 10 # Implicit wait time for elements
+    "implicit_wait": 10, # Implicit wait time for elements
+    "collect_body_text": True,   # Store the first 2000 characters of each student page
+    "collect_screenshot": False  # Save a PNG of each student page
 }
 
 # Output settings
@@ -6,17 +6,14 @@ Dashboard Data Scraper - Navigate to admin dashboard and gather data
 import time
 import logging
 import os
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
-import json
+import orjson
 from datetime import datetime
 from dotenv import load_dotenv
+from session import get_session, close_session, INSPECT_SECONDS
 
 # Load environment variables
 load_dotenv()
@@ -25,28 +22,88 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Each script below gathers one kind of dashboard element with all the
+# attributes scrape_dashboard_data records, in a single round-trip. SVG <a>
+# elements have no innerText and an object-valued href, so links fall back to
+# textContent and the href attribute
+_LINKS_JS = """
+return Array.from(document.querySelectorAll('a'), a => ({
+    href: typeof a.href === 'string' ? a.href : a.getAttribute('href'),
+    text: (a.innerText ?? a.textContent ?? '').trim()
+})).filter(link => link.href && link.text);
+"""
+
+_BUTTONS_JS = """
+return Array.from(document.querySelectorAll('button'), b => ({
+    text: b.innerText.trim(),
+    onclick: b.getAttribute('onclick'),
+    classes: b.getAttribute('class')
+})).filter(button => button.text);
+"""
+
+# Row count, header texts and the cell texts of the first three rows per table
+_TABLES_JS = """
+return Array.from(document.querySelectorAll('table'), (table, index) => {
+    const rows = table.querySelectorAll('tr');
+    const sample = [];
+    for (let i = 0; i < rows.length && i < 3; i++) {
+        const cells = Array.from(rows[i].querySelectorAll('td'), td => td.innerText.trim());
+        if (cells.length) sample.push(cells);
+    }
+    return {
+        index: index,
+        rows: rows.length,
+        headers: Array.from(table.querySelectorAll('th'), th => th.innerText.trim()),
+        sample_data: sample
+    };
+});
+"""
+
+_HEADINGS_JS = """
+const headings = [];
+for (const h of document.querySelectorAll('h1, h2, h3, h4, h5, h6')) {
+    const text = h.innerText.trim();
+    if (text) headings.push({level: Number(h.tagName[1]), text: text});
+}
+return headings;
+"""
+
+_FORMS_JS = """
+return Array.from(document.querySelectorAll('form'), (form, index) => ({
+    index: index,
+    action: form.action,
+    method: form.method,
+    inputs: form.querySelectorAll('input').length,
+    selects: form.querySelectorAll('select').length,
+    textareas: form.querySelectorAll('textarea').length
+}));
+"""
+
+# Every link with its href, text and element, for the back-button fallback search
+_LINK_TARGETS_JS = """
+return Array.from(document.querySelectorAll('a'), a => ({
+    href: typeof a.href === 'string' ? a.href : a.getAttribute('href'),
+    text: (a.innerText ?? a.textContent ?? '').trim(),
+    element: a
+}));
+"""
+
+# Every collection above in one round-trip, keyed by name
+_DASHBOARD_ELEMENTS_JS = "return {%s};" % ", ".join(
+    f"{name}: (() => {{{script}}})()" for name, script in (
+        ("links", _LINKS_JS),
+        ("buttons", _BUTTONS_JS),
+        ("tables", _TABLES_JS),
+        ("headings", _HEADINGS_JS),
+        ("forms", _FORMS_JS),
+        ("page_source_snippet", "return document.documentElement.outerHTML.slice(0, 2000);"),
+    )
+)
+
 class DashboardScraper:
-    def __init__(self):
-        self.driver = None
-        self.setup_driver()
-        
-    def setup_driver(self):
-        """Setup Chrome WebDriver in visible mode"""
-        try:
-            chrome_options = Options()
-            # Keep browser visible
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--window-size=1400,1000")
-            
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            self.driver.implicitly_wait(10)
-            logger.info("Dashboard scraper initialized")
-            
-        except Exception as e:
-            logger.error(f"Failed to initialize WebDriver: {str(e)}")
-            raise
+    def __init__(self, driver):
+        """Scrape with an existing driver; the caller owns and closes it"""
+        self.driver = driver
     
     def login_quick(self):
         """Quick login function"""
@@ -59,17 +116,22 @@ class DashboardScraper:
                 
             # Find and fill login form quickly
             try:
+                password_field = WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='password']"))
+                )
                 username_field = self.driver.find_element(By.CSS_SELECTOR, "input[type='email'], input[name='email'], input[name='username']")
-                password_field = self.driver.find_element(By.CSS_SELECTOR, "input[type='password']")
                 
                 username_field.send_keys(username)
                 password_field.send_keys(password)
-                password_field.send_keys("\n")  # Submit
+                login_url = self.driver.current_url
+                submit_button = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit'], input[type='submit']")
+                submit_button.click()
                 
-                time.sleep(3)  # Wait for login
+                # Wait for login to redirect away from the form
+                WebDriverWait(self.driver, 15).until(EC.url_changes(login_url))
                 return True
                 
-            except NoSuchElementException:
+            except (NoSuchElementException, TimeoutException):
                 return False
                 
         except Exception as e:
@@ -89,10 +151,10 @@ class DashboardScraper:
                 if not self.login_quick():
                     return {"error": "Login failed"}
                 
-                # Navigate again after login
-                self.driver.get("https://app.alphamath.school/admin/downloads")
+                # Navigate again after login, unless it already redirected back here
+                if '/downloads' not in self.driver.current_url:
+                    self.driver.get("https://app.alphamath.school/admin/downloads")
                 print("✅ Login successful!")
-                time.sleep(3)
             else:
                 print("✅ Already logged in!")
             
@@ -100,47 +162,32 @@ class DashboardScraper:
             print(f"🔍 Page title: {self.driver.title}")
             print(f"🔍 Current URL: {self.driver.current_url}")
             
-            # Wait a bit for page to fully load
-            time.sleep(5)
-            
-            # Look for the back button
-            back_button_selectors = [
-                "a[href='/admin']",
-                "a[href*='admin']",
-                "a:contains('Back')",
-                "a:contains('Dashboard')",
-                ".back-button",
-                "[href*='admin']:not([href*='downloads'])"
-            ]
+            # Wait for the page's links to render
+            WebDriverWait(self.driver, 15).until(EC.presence_of_element_located((By.TAG_NAME, "a")))
             
+            # Look for the back button: one combined CSS query, then a text match
             back_button = None
-            for selector in back_button_selectors:
-                try:
-                    if ":contains" in selector:
-                        # Use XPath for text content
-                        xpath = f"//a[contains(text(), 'Back')]"
-                        back_button = self.driver.find_element(By.XPATH, xpath)
-                        break
-                    else:
-                        back_button = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        break
-                except NoSuchElementException:
-                    continue
+            candidates = self.driver.find_elements(
+                By.CSS_SELECTOR, "a[href='/admin'], a[href*='admin']:not([href*='downloads']), .back-button"
+            ) or self.driver.find_elements(
+                By.XPATH, "//a[contains(text(), 'Back') or contains(text(), 'Dashboard')]"
+            )
+            if candidates:
+                back_button = candidates[0]
             
             if not back_button:
                 # Try to find any link with "admin" in href that's not downloads
                 print("🔍 Searching all links on the page...")
                 try:
-                    all_links = self.driver.find_elements(By.TAG_NAME, "a")
+                    all_links = self.driver.execute_script(_LINK_TARGETS_JS)
                     print(f"📋 Found {len(all_links)} total links:")
                     
                     for i, link in enumerate(all_links[:10]):  # Show first 10 links
-                        href = link.get_attribute('href')
-                        text = link.text.strip()
-                        print(f"   {i+1}. '{text}' -> {href}")
+                        href = link['href']
+                        print(f"   {i+1}. '{link['text']}' -> {href}")
                         
                         if href and 'admin' in href and 'downloads' not in href:
-                            back_button = link
+                            back_button = link['element']
                             print(f"🎯 This looks like our back button!")
                             break
                     
@@ -156,14 +203,18 @@ class DashboardScraper:
                 print(f"   Text: '{back_button.text.strip()}'")
                 print(f"   URL: {back_button.get_attribute('href')}")
                 
-                # Wait a moment for user to see
-                time.sleep(2)
+                # Pause a moment so the user can see it, when running for inspection
+                if INSPECT_SECONDS:
+                    time.sleep(2)
                 
                 # Click the back button
+                downloads_url = self.driver.current_url
                 back_button.click()
                 
-                # Wait for dashboard to load
-                time.sleep(5)
+                # Wait for the dashboard to replace the downloads page and render its content
+                wait = WebDriverWait(self.driver, 15)
+                wait.until(EC.url_changes(downloads_url))
+                wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "h1, table")))
                 print("✅ Clicked back button, now on dashboard!")
                 
                 return True
@@ -186,8 +237,13 @@ class DashboardScraper:
             print(f"📄 Page Title: {title}")
             print(f"⏰ Waiting for dashboard content to load...")
             
-            # Wait longer for dynamic content
-            time.sleep(10)
+            # Wait for a dashboard landmark instead of a fixed delay
+            try:
+                WebDriverWait(self.driver, 15).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "h1, h2, table"))
+                )
+            except TimeoutException:
+                print("⚠️  No dashboard heading or table appeared, collecting what is there")
             
             # Collect various types of data
             dashboard_data = {
@@ -197,124 +253,40 @@ class DashboardScraper:
                 'status': 'success'
             }
             
-            # Get all links
-            print("🔗 Collecting all links...")
-            links = []
+            # Read every element kind from the page in a single script call
             try:
-                link_elements = self.driver.find_elements(By.TAG_NAME, "a")
-                for link in link_elements:
-                    href = link.get_attribute('href')
-                    text = link.text.strip()
-                    if href and text:
-                        links.append({'href': href, 'text': text})
-                print(f"   Found {len(links)} links")
-            except:
-                pass
+                elements = self.driver.execute_script(_DASHBOARD_ELEMENTS_JS)
+            except Exception as e:
+                print(f"⚠️  Could not read dashboard elements: {e}")
+                elements = {}
             
-            dashboard_data['links'] = links
+            # Get all links
+            print("🔗 Collecting all links...")
+            dashboard_data['links'] = elements.get('links', [])
+            print(f"   Found {len(dashboard_data['links'])} links")
             
             # Get all buttons
             print("🔘 Collecting all buttons...")
-            buttons = []
-            try:
-                button_elements = self.driver.find_elements(By.TAG_NAME, "button")
-                for button in button_elements:
-                    text = button.text.strip()
-                    onclick = button.get_attribute('onclick')
-                    classes = button.get_attribute('class')
-                    if text:
-                        buttons.append({
-                            'text': text,
-                            'onclick': onclick,
-                            'classes': classes
-                        })
-                print(f"   Found {len(buttons)} buttons")
-            except:
-                pass
-            
-            dashboard_data['buttons'] = buttons
+            dashboard_data['buttons'] = elements.get('buttons', [])
+            print(f"   Found {len(dashboard_data['buttons'])} buttons")
             
             # Get tables if any
             print("📋 Looking for tables...")
-            tables = []
-            try:
-                table_elements = self.driver.find_elements(By.TAG_NAME, "table")
-                for i, table in enumerate(table_elements):
-                    rows = table.find_elements(By.TAG_NAME, "tr")
-                    table_data = {
-                        'index': i,
-                        'rows': len(rows),
-                        'headers': [],
-                        'sample_data': []
-                    }
-                    
-                    # Get headers
-                    try:
-                        header_cells = table.find_elements(By.TAG_NAME, "th")
-                        table_data['headers'] = [cell.text.strip() for cell in header_cells]
-                    except:
-                        pass
-                    
-                    # Get first few rows of data
-                    try:
-                        for row in rows[:3]:  # First 3 rows
-                            cells = row.find_elements(By.TAG_NAME, "td")
-                            row_data = [cell.text.strip() for cell in cells]
-                            if row_data:
-                                table_data['sample_data'].append(row_data)
-                    except:
-                        pass
-                    
-                    tables.append(table_data)
-                print(f"   Found {len(tables)} tables")
-            except:
-                pass
-            
-            dashboard_data['tables'] = tables
+            dashboard_data['tables'] = elements.get('tables', [])
+            print(f"   Found {len(dashboard_data['tables'])} tables")
             
             # Get headings
             print("📝 Collecting page headings...")
-            headings = []
-            try:
-                for level in range(1, 7):
-                    h_elements = self.driver.find_elements(By.TAG_NAME, f"h{level}")
-                    for h in h_elements:
-                        text = h.text.strip()
-                        if text:
-                            headings.append({'level': level, 'text': text})
-                print(f"   Found {len(headings)} headings")
-            except:
-                pass
-            
-            dashboard_data['headings'] = headings
+            dashboard_data['headings'] = elements.get('headings', [])
+            print(f"   Found {len(dashboard_data['headings'])} headings")
             
             # Get forms
             print("📝 Looking for forms...")
-            forms = []
-            try:
-                form_elements = self.driver.find_elements(By.TAG_NAME, "form")
-                for i, form in enumerate(form_elements):
-                    inputs = form.find_elements(By.TAG_NAME, "input")
-                    selects = form.find_elements(By.TAG_NAME, "select")
-                    textareas = form.find_elements(By.TAG_NAME, "textarea")
-                    
-                    form_data = {
-                        'index': i,
-                        'action': form.get_attribute('action'),
-                        'method': form.get_attribute('method'),
-                        'inputs': len(inputs),
-                        'selects': len(selects),
-                        'textareas': len(textareas)
-                    }
-                    forms.append(form_data)
-                print(f"   Found {len(forms)} forms")
-            except:
-                pass
-            
-            dashboard_data['forms'] = forms
+            dashboard_data['forms'] = elements.get('forms', [])
+            print(f"   Found {len(dashboard_data['forms'])} forms")
             
-            # Get page source snippet
-            dashboard_data['page_source_snippet'] = self.driver.page_source[:2000]
+            # Get page source snippet, sliced in the browser so only 2KB comes back
+            dashboard_data['page_source_snippet'] = elements.get('page_source_snippet', '')
             
             print(f"\n✅ Dashboard data collection complete!")
             print(f"📊 Summary:")
@@ -325,10 +297,9 @@ class DashboardScraper:
             print(f"   - Forms: {len(dashboard_data.get('forms', []))}")
             
             # Keep browser open for a bit so user can see
-            print(f"\n👀 Browser will stay open for 15 seconds for you to inspect...")
-            for i in range(15, 0, -1):
-                print(f"⏰ Closing in {i} seconds...")
-                time.sleep(1)
+            if INSPECT_SECONDS:
+                print(f"\n👀 Browser will stay open for {INSPECT_SECONDS} seconds for you to inspect...")
+                time.sleep(INSPECT_SECONDS)
             
             return dashboard_data
             
@@ -341,21 +312,20 @@ class DashboardScraper:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"dashboard_data_{timestamp}.json"
         
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
         
         print(f"💾 Results saved to: {filename}")
         return filename
-    
-    def close(self):
-        if self.driver:
-            self.driver.quit()
+
 
 def main():
-    scraper = None
     try:
         print("🚀 Starting Dashboard Data Scraper")
-        scraper = DashboardScraper()
+        driver = get_session()
+        if not driver:
+            return
+        scraper = DashboardScraper(driver)
         
         # Navigate to dashboard via downloads page
         if scraper.navigate_to_dashboard():
@@ -370,8 +340,7 @@ def main():
     except Exception as e:
         print(f"❌ Error: {str(e)}")
     finally:
-        if scraper:
-            scraper.close()
+        close_session()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
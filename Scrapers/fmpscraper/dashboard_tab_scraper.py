@@ -4,73 +4,83 @@ Dashboard Tab Scraper
 Collects data from dashboard tabs instead of individual student pages
 """
 
+import re
 import time
-import os
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-import json
+from selenium.common.exceptions import TimeoutException
+import orjson
 from datetime import datetime
 from dotenv import load_dotenv
+from session import get_session, close_session, INSPECT_SECONDS
 
 # Load environment variables
 load_dotenv()
 
-def setup_driver():
-    """Setup Chrome WebDriver"""
-    chrome_options = Options()
-    # chrome_options.add_argument("--headless")  # Keep visible
-    chrome_options.add_argument("--window-size=1200,800")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_options)
-    driver.implicitly_wait(10)
-    return driver
+# Header texts and the cell texts of the first 50 rows that have cells, per table
+_TABLES_JS = """
+return Array.from(document.querySelectorAll('table'), (table, index) => {
+    const rows = [];
+    const trs = table.querySelectorAll('tr');
+    for (let i = 0; i < trs.length && i < 50; i++) {
+        const cells = Array.from(trs[i].querySelectorAll('td'), td => td.innerText.trim());
+        if (cells.length) rows.push(cells);
+    }
+    return {
+        table_index: index,
+        headers: Array.from(table.querySelectorAll('th'), th => th.innerText.trim()),
+        rows: rows
+    };
+});
+"""
 
-def login(driver):
-    """Login to the admin panel"""
-    try:
-        print("🔑 Logging in...")
-        
-        # Get credentials from environment
-        username = os.getenv('USERNAME')
-        password = os.getenv('PASSWORD')
-        
-        if not username or not password:
-            print("❌ No credentials found in .env file")
-            return False
-        
-        # Navigate to admin page (will redirect to login if needed)
-        driver.get("https://app.alphamath.school/admin")
-        time.sleep(3)
-        
-        # Find login fields
-        username_field = driver.find_element(By.CSS_SELECTOR, "input[type='email'], input[name='email'], input[name='username']")
-        password_field = driver.find_element(By.CSS_SELECTOR, "input[type='password']")
-        
-        # Fill credentials
-        username_field.clear()
-        username_field.send_keys(username)
-        password_field.clear()
-        password_field.send_keys(password)
-        
-        # Submit
-        submit_button = driver.find_element(By.CSS_SELECTOR, "button[type='submit'], input[type='submit']")
-        submit_button.click()
-        
-        time.sleep(5)
-        print("✅ Login successful!")
-        return True
-        
-    except Exception as e:
-        print(f"❌ Login failed: {e}")
-        return False
+# Run the metric selectors (arguments[0]) as one querySelectorAll and report each
+# short, non-empty match with the first selector (in list order) it satisfies.
+# The selectors only look at the class attribute, so that lookup is cached per class.
+# SVG chart nodes have no innerText, so their textContent is read instead
+_METRICS_JS = """
+const selectors = arguments[0];
+const selectorByClass = new Map();
+const metrics = [];
+for (const el of document.querySelectorAll(selectors.join(', '))) {
+    const text = (el.innerText ?? el.textContent ?? '').trim();
+    if (!text || text.length >= 200) continue;
+    const cls = el.getAttribute('class');
+    if (!selectorByClass.has(cls)) selectorByClass.set(cls, selectors.find(s => el.matches(s)));
+    metrics.push({selector: selectorByClass.get(cls), text: text, class: cls});
+}
+return metrics;
+"""
+
+_HEADINGS_JS = """
+const headings = [];
+for (const h of document.querySelectorAll('h1, h2, h3, h4, h5, h6')) {
+    const text = h.innerText.trim();
+    if (text && text.length < 100) headings.push({type: 'heading', tag: h.tagName.toLowerCase(), text: text});
+}
+return headings;
+"""
+
+# Text, href and element of every match for the tab selectors (arguments[0]), in
+# document order. SVG matches have no innerText and an object-valued href, so
+# those fall back to textContent and the href attribute
+_TABS_JS = """
+return Array.from(document.querySelectorAll(arguments[0].join(', ')), el => ({
+    text: (el.innerText ?? el.textContent ?? '').trim(),
+    href: typeof el.href === 'string' ? el.href : el.getAttribute('href'),
+    element: el
+}));
+"""
+
+# Everything collect_dashboard_data reads from a view, keyed by name
+_DASHBOARD_VIEW_JS = "return {%s};" % ", ".join(
+    f"{name}: (() => {{{script}}})()" for name, script in (
+        ("tables", _TABLES_JS),
+        ("metrics", _METRICS_JS),
+        ("headings", _HEADINGS_JS),
+    )
+)
 
 def navigate_to_dashboard(driver):
     """Navigate to the admin dashboard"""
@@ -79,11 +89,12 @@ def navigate_to_dashboard(driver):
         
         # Try to get to downloads page first
         driver.get("https://app.alphamath.school/admin/downloads")
-        time.sleep(3)
         
         # Look for and click back button
         try:
-            back_button = driver.find_element(By.XPATH, "//a[contains(text(), 'Back to Admin Dashboard')]")
+            back_button = WebDriverWait(driver, 10).until(
+                EC.element_to_be_clickable((By.XPATH, "//a[contains(text(), 'Back to Admin Dashboard')]"))
+            )
             print(f"✅ Found back button: '{back_button.text.strip()}'")
             back_button.click()
             time.sleep(5)
@@ -110,6 +121,7 @@ def find_dashboard_tabs(driver):
     print("🔍 Looking for dashboard tabs and navigation...")
     
     tabs = []
+    seen_texts = set()
     
     # Multiple selectors to find tabs/navigation
     tab_selectors = [
@@ -128,27 +140,27 @@ def find_dashboard_tabs(driver):
         ".tabs .tab"               # Tab elements
     ]
     
-    for selector in tab_selectors:
-        try:
-            elements = driver.find_elements(By.CSS_SELECTOR, selector)
-            for element in elements:
-                tab_text = element.text.strip()
-                tab_href = element.get_attribute('href')
-                
-                # Filter for meaningful tabs
-                if (tab_text and 
-                    len(tab_text) > 0 and 
-                    len(tab_text) < 50 and
-                    tab_text not in [tab['text'] for tab in tabs]):  # Avoid duplicates
-                    
-                    tabs.append({
-                        'text': tab_text,
-                        'href': tab_href,
-                        'element': element,
-                        'selector': selector
-                    })
-        except Exception as e:
+    # One query for all selectors, with each match's text and href in the same
+    # reply; matches come back once each, in document order
+    try:
+        elements = driver.execute_script(_TABS_JS, tab_selectors)
+    except Exception:
+        elements = []
+    
+    for element in elements:
+        tab_text = element['text']
+        tab_href = element['href']
+        
+        # Filter for meaningful tabs, skipping duplicates
+        if not tab_text or len(tab_text) >= 50 or tab_text in seen_texts:
             continue
+        seen_texts.add(tab_text)
+        
+        tabs.append({
+            'text': tab_text,
+            'href': tab_href,
+            'element': element['element']
+        })
     
     print(f"📋 Found {len(tabs)} potential tabs/navigation items:")
     for i, tab in enumerate(tabs):
@@ -169,72 +181,20 @@ def collect_dashboard_data(driver, section_name):
         'metrics': []
     }
     
+    # Look for metric/statistic containers
+    metric_selectors = [
+        ".metric", ".stat", ".number", ".count", ".score",
+        ".value", ".total", ".summary", ".card-body",
+        "[class*='metric']", "[class*='stat']", "[class*='count']"
+    ]
+    
     try:
-        # Collect all tables
-        tables = driver.find_elements(By.TAG_NAME, "table")
-        print(f"   📋 Found {len(tables)} tables")
-        
-        for i, table in enumerate(tables):
-            table_data = {
-                'table_index': i,
-                'headers': [],
-                'rows': []
-            }
-            
-            # Get headers
-            try:
-                headers = table.find_elements(By.TAG_NAME, "th")
-                table_data['headers'] = [h.text.strip() for h in headers]
-            except:
-                pass
-            
-            # Get all rows
-            try:
-                rows = table.find_elements(By.TAG_NAME, "tr")
-                for row in rows[:50]:  # Limit to first 50 rows
-                    cells = row.find_elements(By.TAG_NAME, "td")
-                    if cells:  # Only add rows with data
-                        row_data = [cell.text.strip() for cell in cells]
-                        table_data['rows'].append(row_data)
-            except:
-                pass
-            
-            data['tables'].append(table_data)
-        
-        # Look for metric/statistic containers
-        metric_selectors = [
-            ".metric", ".stat", ".number", ".count", ".score",
-            ".value", ".total", ".summary", ".card-body",
-            "[class*='metric']", "[class*='stat']", "[class*='count']"
-        ]
-        
-        for selector in metric_selectors:
-            try:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                for elem in elements:
-                    text = elem.text.strip()
-                    if text and len(text) < 200:  # Reasonable length
-                        data['metrics'].append({
-                            'selector': selector,
-                            'text': text,
-                            'class': elem.get_attribute('class')
-                        })
-            except:
-                continue
-        
-        # Get general page content (headings, important text)
-        try:
-            headings = driver.find_elements(By.CSS_SELECTOR, "h1, h2, h3, h4, h5, h6")
-            for heading in headings:
-                text = heading.text.strip()
-                if text and len(text) < 100:
-                    data['text_content'].append({
-                        'type': 'heading',
-                        'tag': heading.tag_name,
-                        'text': text
-                    })
-        except:
-            pass
+        # Tables, metrics and headings (general page content) in one round-trip
+        view = driver.execute_script(_DASHBOARD_VIEW_JS, metric_selectors)
+        data['tables'] = view['tables']
+        data['metrics'] = view['metrics']
+        data['text_content'] = view['headings']
+        print(f"   📋 Found {len(data['tables'])} tables")
         
         print(f"   ✅ Collected: {len(data['tables'])} tables, {len(data['metrics'])} metrics, {len(data['text_content'])} content items")
         
@@ -243,22 +203,56 @@ def collect_dashboard_data(driver, section_name):
     
     return data
 
-def run_dashboard_scraper():
-    """Main function to run the dashboard tab scraper"""
-    driver = None
+def _tab_key(tab_text):
+    """Key a tab's section under in the saved data"""
+    return f"tab_{tab_text.replace(' ', '_').replace('/', '_').lower()}"
+
+def collect_linked_tabs(driver, tabs):
+    """Open every linked tab in its own browser window at once, then collect each one"""
+    results = {}
+    main_handle = driver.current_window_handle
     
+    # Start all the loads before reading any of them, so the pages load side by
+    # side and the dashboard window itself is never navigated away from
+    opened = []
+    for tab in tabs:
+        handles_before = set(driver.window_handles)
+        driver.execute_script("window.open(arguments[0], '_blank');", tab['href'])
+        new_handles = set(driver.window_handles) - handles_before
+        if new_handles:
+            opened.append((tab, new_handles.pop()))
+        else:
+            print(f"   ⚠️ Could not open tab '{tab['text']}' in a new window")
+    
+    for tab, handle in opened:
+        tab_text = tab['text']
+        print(f"\n🔄 Exploring tab: '{tab_text}'")
+        try:
+            driver.switch_to.window(handle)
+            try:
+                WebDriverWait(driver, 15).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "h1, h2, table"))
+                )
+            except TimeoutException:
+                print(f"   ⚠️ No heading or table appeared on '{tab_text}', collecting what is there")
+            
+            results[_tab_key(tab_text)] = collect_dashboard_data(driver, tab_text)
+            print(f"   ✅ Collected data from '{tab_text}' tab")
+            
+        except Exception as e:
+            print(f"   ⚠️ Could not access tab '{tab_text}': {e}")
+        finally:
+            if driver.current_window_handle != main_handle:
+                driver.close()
+            driver.switch_to.window(main_handle)
+    
+    return results
+
+def run_dashboard_scraper(driver):
+    """Run the dashboard tab scraper on an already logged-in driver"""
     try:
         print("🚀 Starting Dashboard Tab Scraper")
         
-        # Setup browser
-        print("🌐 Setting up browser...")
-        driver = setup_driver()
-        print("✅ Browser opened - you can see it!")
-        
-        # Login
-        if not login(driver):
-            return
-        
         # Navigate to dashboard
         if not navigate_to_dashboard(driver):
             return
@@ -273,34 +267,40 @@ def run_dashboard_scraper():
         # Target specific tabs that might contain useful data
         target_keywords = ['CQPM', 'Analytics', 'Reports', 'Progress', 'Data', 'Metrics', 'Dashboard', 'Students', 'Summary']
         
-        for tab in tabs:
+        # Check which tabs might contain useful data, matching all keywords in one scan
+        target_pattern = re.compile('|'.join(map(re.escape, target_keywords)), re.IGNORECASE)
+        target_tabs = [tab for tab in tabs if target_pattern.search(tab['text'])]
+        
+        # Tabs with a URL load in parallel browser tabs
+        all_data.update(collect_linked_tabs(driver, [tab for tab in target_tabs if tab['href']]))
+        
+        # Tabs without one have to be clicked in the dashboard window
+        for tab in target_tabs:
+            if tab['href']:
+                continue
             tab_text = tab['text']
+            print(f"\n🔄 Exploring tab: '{tab_text}'")
             
-            # Check if this tab might contain useful data
-            if any(keyword.lower() in tab_text.lower() for keyword in target_keywords):
-                print(f"\n🔄 Exploring tab: '{tab_text}'")
+            try:
+                # Click the tab
+                driver.execute_script("arguments[0].click();", tab['element'])
+                time.sleep(4)  # Wait for content to load
+                
+                # Collect data from this tab
+                all_data[_tab_key(tab_text)] = collect_dashboard_data(driver, tab_text)
                 
-                try:
-                    # Click the tab
-                    driver.execute_script("arguments[0].click();", tab['element'])
-                    time.sleep(4)  # Wait for content to load
-                    
-                    # Collect data from this tab
-                    tab_key = f"tab_{tab_text.replace(' ', '_').replace('/', '_').lower()}"
-                    all_data[tab_key] = collect_dashboard_data(driver, tab_text)
-                    
-                    print(f"   ✅ Collected data from '{tab_text}' tab")
-                    
-                except Exception as e:
-                    print(f"   ⚠️ Could not access tab '{tab_text}': {e}")
-                    continue
+                print(f"   ✅ Collected data from '{tab_text}' tab")
+                
+            except Exception as e:
+                print(f"   ⚠️ Could not access tab '{tab_text}': {e}")
+                continue
         
         # Save results
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"dashboard_tab_data_{timestamp}.json"
         
-        with open(filename, 'w') as f:
-            json.dump(all_data, f, indent=2, ensure_ascii=False)
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(all_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
         
         print(f"\n🎉 Dashboard data collection complete!")
         print(f"📊 Summary:")
@@ -309,18 +309,23 @@ def run_dashboard_scraper():
         print(f"💾 Results saved to: {filename}")
         
         # Keep browser open for inspection
-        print("\n👀 Browser will stay open for 30 seconds for you to inspect...")
-        for i in range(30, 0, -1):
-            print(f"⏰ Closing in {i} seconds...", end="\r")
-            time.sleep(1)
+        if INSPECT_SECONDS:
+            print(f"\n👀 Browser will stay open for {INSPECT_SECONDS} seconds for you to inspect...")
+            time.sleep(INSPECT_SECONDS)
         
     except Exception as e:
         print(f"❌ Error: {e}")
-        
-    finally:
+
+def main():
+    """Run the tab scraper on the shared browser session, closing it afterwards"""
+    try:
+        print("🌐 Setting up browser...")
+        driver = get_session()
         if driver:
-            driver.quit()
-            print("\n👋 Browser closed")
+            print("✅ Browser opened - you can see it!")
+            run_dashboard_scraper(driver)
+    finally:
+        close_session()
 
 if __name__ == "__main__":
-    run_dashboard_scraper()
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -6,17 +6,15 @@ Dashboard Viewer - Show students on the admin dashboard
 import time
 import logging
 import os
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
 import json
 from datetime import datetime
 from dotenv import load_dotenv
+from session import start_chrome, iter_first_column
 
 # Load environment variables
 load_dotenv()
@@ -39,9 +37,8 @@ class DashboardViewer:
             chrome_options.add_argument("--disable-dev-shm-usage")
             chrome_options.add_argument("--window-size=1400,1000")
             
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            self.driver.implicitly_wait(10)
+            self.driver = start_chrome(chrome_options)
+            # No implicit wait: steps that need an element wait for it explicitly
             logger.info("Dashboard viewer initialized")
             
         except Exception as e:
@@ -58,17 +55,21 @@ class DashboardViewer:
                 return False
                 
             try:
+                password_field = WebDriverWait(self.driver, 5).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='password']"))
+                )
                 username_field = self.driver.find_element(By.CSS_SELECTOR, "input[type='email'], input[name='email'], input[name='username']")
-                password_field = self.driver.find_element(By.CSS_SELECTOR, "input[type='password']")
                 
                 username_field.send_keys(username)
                 password_field.send_keys(password)
+                login_url = self.driver.current_url
                 password_field.send_keys("\n")  # Submit
                 
-                time.sleep(2)  # Quick wait
+                # Wait for login to redirect away from the form
+                WebDriverWait(self.driver, 10).until(EC.url_changes(login_url))
                 return True
                 
-            except NoSuchElementException:
+            except (NoSuchElementException, TimeoutException):
                 return False
                 
         except Exception as e:
@@ -90,7 +91,6 @@ class DashboardViewer:
                 # Navigate again after login
                 self.driver.get("https://app.alphamath.school/admin")
                 print("✅ Login successful! Waiting for dashboard to load...")
-                time.sleep(5)
             else:
                 print("✅ Already logged in!")
             
@@ -115,45 +115,22 @@ class DashboardViewer:
             # Collect students by scrolling
             print("\n📜 Scrolling through page to collect all students...")
             all_students = []
-            scroll_count = 0
-            
-            # Start from top
-            self.driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(2)
+            seen_students = set()
             
-            while scroll_count < 20:  # Limit scrolling
-                # Get current students
-                rows = self.driver.find_elements(By.XPATH, "//table//tr")
-                
+            # Each step yields the students it revealed; seen_students still guards
+            # against repeats if the page reloads and forgets what it sent
+            for scroll_count, names in enumerate(iter_first_column(self.driver, 400, 20)):
                 current_visible = []
-                for row in rows:
-                    try:
-                        first_cell = row.find_element(By.XPATH, ".//td[1]")
-                        name = first_cell.text.strip()
-                        
-                        # Filter valid student names
-                        if name and len(name) > 2 and name not in ['NAME', 'Name', 'CAMPUS']:
-                            if name not in all_students:
-                                all_students.append(name)
-                                current_visible.append(name)
-                    except:
-                        continue
+                for name in names:
+                    # Filter valid student names
+                    if name and len(name) > 2 and name not in ['NAME', 'Name', 'CAMPUS']:
+                        if name not in seen_students:
+                            seen_students.add(name)
+                            all_students.append(name)
+                            current_visible.append(name)
                 
                 if current_visible:
                     print(f"   Found {len(current_visible)} new students in scroll {scroll_count + 1}")
-                
-                # Scroll down
-                self.driver.execute_script("window.scrollBy(0, 400);")
-                time.sleep(1)
-                scroll_count += 1
-                
-                # Check if we hit bottom
-                scroll_height = self.driver.execute_script("return document.body.scrollHeight")
-                current_scroll = self.driver.execute_script("return window.pageYOffset + window.innerHeight")
-                
-                if current_scroll >= scroll_height - 100:
-                    print("📜 Reached bottom of page")
-                    break
             
             print(f"\n🎉 Student Discovery Complete!")
             print(f"📊 Total students found: {len(all_students)}")
@@ -178,15 +155,23 @@ class DashboardViewer:
                 print(f"📚 Your target students ({len(target_students)}):")
                 matches = []
                 
+                # Lowercase every dashboard name once; exact matches come from a dict
+                # lookup and only the rest fall back to the substring scan
+                lower_available = [(available, available.lower()) for available in all_students]
+                available_by_lower = {}
+                for available, lower in lower_available:
+                    available_by_lower.setdefault(lower, available)
+                
                 for target in target_students:
-                    found = False
-                    for available in all_students:
-                        if target.lower() in available.lower() or available.lower() in target.lower():
-                            matches.append((target, available))
-                            print(f"   ✅ '{target}' → FOUND as '{available}'")
-                            found = True
-                            break
-                    if not found:
+                    target_lower = target.lower()
+                    available = available_by_lower.get(target_lower)
+                    if available is None:
+                        available = next((available for available, lower in lower_available
+                                          if target_lower in lower or lower in target_lower), None)
+                    if available is not None:
+                        matches.append((target, available))
+                        print(f"   ✅ '{target}' → FOUND as '{available}'")
+                    else:
                         print(f"   ❌ '{target}' → NOT FOUND")
                 
                 print(f"\n📊 Summary:")
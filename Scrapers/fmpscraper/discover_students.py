@@ -5,14 +5,12 @@ Student Discovery - Just show all students available on dashboard
 
 import time
 import os
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 from dotenv import load_dotenv
+from session import start_chrome, iter_first_column
 
 load_dotenv()
 
@@ -24,15 +22,19 @@ def discover_students():
         # Setup browser
         chrome_options = Options()
         chrome_options.add_argument("--window-size=1400,1000")
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        driver = start_chrome(chrome_options)
         
         print("✅ Browser opened")
         print("🔑 Logging in...")
         
         # Navigate and login
         driver.get("https://app.alphamath.school/admin")
-        time.sleep(3)
+        
+        # Wait until either the login form or the dashboard table has rendered
+        WebDriverWait(driver, 15).until(EC.any_of(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='password']")),
+            EC.presence_of_element_located((By.TAG_NAME, "table"))
+        ))
         
         # Login if needed
         if "login" in driver.page_source.lower():
@@ -45,8 +47,6 @@ def discover_students():
             username_field.send_keys(username)
             password_field.send_keys(password)
             password_field.send_keys("\n")
-            
-            time.sleep(5)
         
         print("✅ Logged in successfully")
         print("📋 Discovering all students...")
@@ -62,24 +62,14 @@ def discover_students():
         
         # Collect all students by scrolling
         all_students = set()
-        scroll_attempts = 0
         last_count = 0
         
-        while scroll_attempts < 30:  # Limit scrolling attempts
-            # Get current students
-            rows = driver.find_elements(By.XPATH, "//table//tr")
-            
-            for row in rows:
-                try:
-                    # Get first cell text (student name)
-                    first_cell = row.find_element(By.XPATH, ".//td[1]")
-                    name = first_cell.text.strip()
-                    
-                    # Filter valid names
-                    if name and len(name) > 2 and name not in ['NAME', 'Name']:
-                        all_students.add(name)
-                except:
-                    continue
+        # Each step yields the students it revealed (first cell text is the student name)
+        for names in iter_first_column(driver, 500, 30):
+            for name in names:
+                # Filter valid names
+                if name and len(name) > 2 and name not in ['NAME', 'Name']:
+                    all_students.add(name)
             
             current_count = len(all_students)
             
@@ -87,20 +77,6 @@ def discover_students():
             if current_count > last_count:
                 print(f"   📚 Found {current_count} total students so far...")
                 last_count = current_count
-            
-            # Scroll down
-            driver.execute_script("window.scrollBy(0, 500);")
-            time.sleep(1)
-            
-            # Check if we've hit bottom
-            scroll_height = driver.execute_script("return document.body.scrollHeight")
-            current_scroll = driver.execute_script("return window.pageYOffset + window.innerHeight")
-            
-            if current_scroll >= scroll_height - 100:  # Near bottom
-                print("📜 Reached bottom of page")
-                break
-                
-            scroll_attempts += 1
         
         print(f"\n🎉 Discovery Complete!")
         print(f"📊 Total students found: {len(all_students)}")
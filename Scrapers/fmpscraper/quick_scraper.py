@@ -3,20 +3,17 @@
 Quick Download Scraper - Focused version for faster results
 """
 
-import time
 import logging
 import os
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
 import json
 from datetime import datetime
 from dotenv import load_dotenv
+from session import start_chrome
 
 # Load environment variables
 load_dotenv()
@@ -25,6 +22,24 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# href and text of every element matching the download selectors (arguments[0]).
+# SVG elements (sprite <use>, SVG links) have no innerText and an object-valued
+# href, so fall back to textContent and the href attribute for them
+_DOWNLOAD_LINKS_JS = """
+return Array.from(document.querySelectorAll(arguments[0].join(', ')), el => ({
+    href: typeof el.href === 'string' ? el.href : el.getAttribute('href'),
+    text: (el.innerText ?? el.textContent ?? '').trim()
+}));
+"""
+
+# href and text of the first 20 links, skipping any without an href
+_ALL_LINKS_JS = """
+return Array.from(document.querySelectorAll('a'), a => ({
+    href: typeof a.href === 'string' ? a.href : a.getAttribute('href'),
+    text: (a.innerText ?? a.textContent ?? '').trim()
+})).slice(0, 20).filter(link => link.href);
+"""
+
 class QuickDownloadScraper:
     def __init__(self):
         self.driver = None
@@ -43,9 +58,8 @@ class QuickDownloadScraper:
             # chrome_options.add_argument("--disable-javascript")  # Commented out
             chrome_options.add_argument("--window-size=1200,800")  # Set a good window size
             
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            self.driver.implicitly_wait(10)
+            self.driver = start_chrome(chrome_options)
+            # No implicit wait: steps that need an element wait for it explicitly
             logger.info("Quick scraper initialized")
             
         except Exception as e:
@@ -63,17 +77,21 @@ class QuickDownloadScraper:
                 
             # Find and fill login form quickly
             try:
+                password_field = WebDriverWait(self.driver, 5).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='password']"))
+                )
                 username_field = self.driver.find_element(By.CSS_SELECTOR, "input[type='email'], input[name='email'], input[name='username']")
-                password_field = self.driver.find_element(By.CSS_SELECTOR, "input[type='password']")
                 
                 username_field.send_keys(username)
                 password_field.send_keys(password)
+                login_url = self.driver.current_url
                 password_field.send_keys("\n")  # Submit
                 
-                time.sleep(2)  # Quick wait
+                # Wait for login to redirect away from the form
+                WebDriverWait(self.driver, 10).until(EC.url_changes(login_url))
                 return True
                 
-            except NoSuchElementException:
+            except (NoSuchElementException, TimeoutException):
                 return False
                 
         except Exception as e:
@@ -95,7 +113,6 @@ class QuickDownloadScraper:
                 # Navigate again after login
                 self.driver.get(url)
                 print("✅ Login successful! Waiting for page to load...")
-                time.sleep(5)  # Give more time for JavaScript to load
             
             # Get page info quickly
             title = self.driver.title
@@ -105,15 +122,12 @@ class QuickDownloadScraper:
             print(f"🔗 Current URL: {current_url}")
             print("🔍 Looking for download content... (you can see the page in the browser window)")
             
-            # Wait for dynamic content and let user inspect the page
+            # Wait for the page's JavaScript to render its links
             print("\n⏳ Waiting for JavaScript content to load...")
-            print("👀 You can now see the page in the Chrome browser window!")
-            print("🔍 Look for any download links, files, or content on the page")
-            
-            # Wait longer for content and user inspection
-            for i in range(10, 0, -1):
-                print(f"⏰ Continuing scraping in {i} seconds... (page visible in browser)")
-                time.sleep(1)
+            try:
+                WebDriverWait(self.driver, 15).until(EC.presence_of_element_located((By.TAG_NAME, "a")))
+            except TimeoutException:
+                print("⚠️  No links appeared, collecting what is there")
             
             # Extract download links fast
             download_links = []
@@ -130,30 +144,27 @@ class QuickDownloadScraper:
                 "[href*='asset']"
             ]
             
-            for selector in selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for elem in elements:
-                        href = elem.get_attribute('href')
-                        text = elem.text.strip()
-                        if href and href not in [link.get('href') for link in download_links]:
-                            download_links.append({
-                                'href': href,
-                                'text': text,
-                                'selector': selector
-                            })
-                except:
-                    continue
+            # One query for all patterns, with each match's href and text in the
+            # same reply; matches come back once each, in document order
+            seen_hrefs = set()
+            try:
+                elements = self.driver.execute_script(_DOWNLOAD_LINKS_JS, selectors)
+            except:
+                elements = []
+            
+            for elem in elements:
+                href = elem['href']
+                if href and href not in seen_hrefs:
+                    seen_hrefs.add(href)
+                    download_links.append({
+                        'href': href,
+                        'text': elem['text']
+                    })
             
             # Get all links as backup
             all_links = []
             try:
-                links = self.driver.find_elements(By.TAG_NAME, "a")
-                for link in links[:20]:  # Limit to first 20 links
-                    href = link.get_attribute('href')
-                    text = link.text.strip()
-                    if href:
-                        all_links.append({'href': href, 'text': text})
+                all_links = self.driver.execute_script(_ALL_LINKS_JS)
             except:
                 pass
             
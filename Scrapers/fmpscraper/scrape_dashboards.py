@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Dashboard Scrapers - Run the dashboard and tab scrapers on one logged-in browser
+"""
+
+from dashboard_scraper import DashboardScraper
+from dashboard_tab_scraper import run_dashboard_scraper
+from session import get_session, close_session
+
+def main():
+    """Scrape the dashboard, then its tabs, with a single Chrome start and login"""
+    try:
+        print("🚀 Starting Dashboard Scrapers")
+        driver = get_session()
+        if not driver:
+            return
+        
+        # Dashboard overview via the downloads page's back button
+        scraper = DashboardScraper(driver)
+        if scraper.navigate_to_dashboard():
+            scraper.save_results(scraper.scrape_dashboard_data())
+        else:
+            print("❌ Failed to navigate to dashboard")
+        
+        # Dashboard tabs, reusing the same browser and login
+        run_dashboard_scraper(driver)
+    
+    except Exception as e:
+        print(f"❌ Error: {str(e)}")
+    finally:
+        close_session()
+
+if __name__ == "__main__":
+    main()
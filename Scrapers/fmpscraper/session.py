@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Browser Session - One logged-in Chrome shared by the dashboard scrapers
+"""
+
+import functools
+import os
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import SessionNotCreatedException, TimeoutException
+from webdriver_manager.chrome import ChromeDriverManager
+from dotenv import load_dotenv
+from config import SCRAPER_CONFIG
+
+# Load environment variables
+load_dotenv()
+
+ADMIN_URL = "https://app.alphamath.school/admin"
+
+# Seconds a scraper keeps the browser open for inspection when it finishes (0 skips it)
+INSPECT_SECONDS = int(os.getenv('INSPECT_SECONDS', '0'))
+
+# Text of the first cell of every table row not already returned during this scan,
+# read in one round-trip. The page remembers what it has sent, so each scroll step
+# only transfers the rows it revealed; pass true (arguments[0]) to start a new scan
+_FIRST_COLUMN_JS = """
+if (arguments[0] || !window._seenFirstColumn) window._seenFirstColumn = new Set();
+const seen = window._seenFirstColumn;
+const names = [];
+for (const row of document.querySelectorAll('table tr')) {
+    const cell = row.querySelector('td');
+    if (!cell) continue;
+    const name = cell.innerText.trim();
+    if (name && !seen.has(name)) {
+        seen.add(name);
+        names.push(name);
+    }
+}
+return names;
+"""
+
+# Number of table rows currently in the DOM, to tell when a scroll has loaded more
+_ROW_COUNT_JS = "return document.querySelectorAll('table tr').length;"
+
+# Scroll down by arguments[0] pixels in the same round-trip that reports the row
+# count before the scroll and whether the window is now within 100px of the bottom
+_SCROLL_STEP_JS = """
+const rows = document.querySelectorAll('table tr').length;
+window.scrollBy(0, arguments[0]);
+return {rows: rows, bottom: window.pageYOffset + window.innerHeight >= document.body.scrollHeight - 100};
+"""
+
+# The logged-in driver every scraper in this process reuses
+_driver = None
+
+# Where the resolved chromedriver path is kept between runs
+_DRIVER_PATH_CACHE = os.path.expanduser("~/.cache/scrapers/chromedriver-path")
+
+# Chrome profile kept between runs; it holds a logged-in admin session, so it lives
+# in the user's cache rather than a shared /tmp path. Chrome locks a profile, so
+# only one scraper at a time can use it; give concurrent runs their own directory
+PROFILE_DIR = os.getenv("CHROME_PROFILE_DIR", os.path.expanduser("~/.cache/scrapers/fmpscraper-profile"))
+
+@functools.lru_cache(maxsize=1)
+def driver_path():
+    """Resolve the chromedriver binary, reusing the path an earlier run resolved"""
+    path = os.getenv("CHROMEDRIVER_PATH")
+    if path:
+        return path
+    
+    # webdriver_manager checks for a newer driver on every install(), so skip it
+    # while the binary it found last time is still there
+    try:
+        with open(_DRIVER_PATH_CACHE) as f:
+            path = f.read().strip()
+    except OSError:
+        path = None
+    if path and os.path.exists(path):
+        return path
+    
+    path = ChromeDriverManager().install()
+    try:
+        os.makedirs(os.path.dirname(_DRIVER_PATH_CACHE), exist_ok=True)
+        with open(_DRIVER_PATH_CACHE, "w") as f:
+            f.write(path)
+    except OSError as e:
+        print(f"⚠️ Could not cache chromedriver path: {e}")
+    return path
+
+def start_chrome(options):
+    """Start Chrome on the cached chromedriver, resolving a new one if Chrome has updated past it"""
+    try:
+        return webdriver.Chrome(service=Service(driver_path()), options=options)
+    except SessionNotCreatedException:
+        # An explicit CHROMEDRIVER_PATH is the user's to fix
+        if os.getenv("CHROMEDRIVER_PATH"):
+            raise
+        print("⚠️ Cached chromedriver does not match this Chrome, resolving it again...")
+        try:
+            os.remove(_DRIVER_PATH_CACHE)
+        except OSError:
+            pass
+        driver_path.cache_clear()
+        return webdriver.Chrome(service=Service(driver_path()), options=options)
+
+def setup_driver():
+    """Setup Chrome WebDriver"""
+    chrome_options = Options()
+    # Visible by default; automated runs set HEADLESS_MODE=true to skip painting entirely
+    if os.getenv("HEADLESS_MODE", str(SCRAPER_CONFIG["headless"])).lower() == "true":
+        chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--disable-features=VizDisplayCompositor")
+    chrome_options.add_argument("--window-size=1400,1000")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    # Only the DOM is scraped, so skip images and notification prompts and
+    # let driver.get return at DOMContentLoaded
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2
+    })
+    chrome_options.page_load_strategy = "eager"
+    # Keep cookies between runs so a warm profile starts out logged in
+    os.makedirs(PROFILE_DIR, mode=0o700, exist_ok=True)
+    chrome_options.add_argument(f"--user-data-dir={PROFILE_DIR}")
+    
+    driver = start_chrome(chrome_options)
+    # No implicit wait: steps that need an element wait for it explicitly
+    return driver
+
+def login(driver):
+    """Login to the admin panel, unless the browser profile is already logged in"""
+    try:
+        # Navigate to admin page (will redirect to login if needed)
+        driver.get(ADMIN_URL)
+        
+        # Wait until either the login form or the dashboard table has rendered
+        WebDriverWait(driver, 15).until(EC.any_of(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='password']")),
+            EC.presence_of_element_located((By.TAG_NAME, "table"))
+        ))
+        if not driver.find_elements(By.CSS_SELECTOR, "input[type='password']"):
+            print("✅ Already logged in!")
+            return True
+        
+        print("🔑 Logging in...")
+        
+        # Get credentials from environment
+        username = os.getenv('USERNAME')
+        password = os.getenv('PASSWORD')
+        
+        if not username or not password:
+            print("❌ No credentials found in .env file")
+            return False
+        
+        username_field = driver.find_element(By.CSS_SELECTOR, "input[type='email'], input[name='email'], input[name='username']")
+        password_field = driver.find_element(By.CSS_SELECTOR, "input[type='password']")
+        
+        # Fill credentials
+        username_field.clear()
+        username_field.send_keys(username)
+        password_field.clear()
+        password_field.send_keys(password)
+        
+        # Submit and wait to be redirected away from the form
+        login_url = driver.current_url
+        submit_button = driver.find_element(By.CSS_SELECTOR, "button[type='submit'], input[type='submit']")
+        submit_button.click()
+        WebDriverWait(driver, 15).until(EC.url_changes(login_url))
+        
+        print("✅ Login successful!")
+        return True
+    
+    except Exception as e:
+        print(f"❌ Login failed: {e}")
+        return False
+
+def get_session():
+    """Return the shared logged-in driver, starting Chrome and logging in on first use"""
+    global _driver
+    if _driver is None:
+        driver = setup_driver()
+        if not login(driver):
+            driver.quit()
+            return None
+        _driver = driver
+    return _driver
+
+def close_session():
+    """Quit the shared driver, if one was started"""
+    global _driver
+    if _driver is not None:
+        _driver.quit()
+        _driver = None
+        print("👋 Browser closed")
+
+def iter_first_column(driver, step, max_scrolls):
+    """Scroll down the page from the top, yielding the first-column names each step reveals"""
+    driver.execute_script("window.scrollTo(0, 0);")
+    for scroll in range(max_scrolls):
+        yield driver.execute_script(_FIRST_COLUMN_JS, scroll == 0)
+        
+        # Scroll down, then give the table up to a second to load more rows
+        state = driver.execute_script(_SCROLL_STEP_JS, step)
+        try:
+            WebDriverWait(driver, 1).until(lambda d: d.execute_script(_ROW_COUNT_JS) != state['rows'])
+            loaded_more = True
+        except TimeoutException:
+            loaded_more = False
+        
+        # Stop once we are at the bottom and scrolling there loaded nothing new
+        if state['bottom'] and not loaded_more:
+            print("📜 Reached bottom of page")
+            return
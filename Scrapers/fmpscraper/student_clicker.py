@@ -11,6 +11,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
 from webdriver_manager.chrome import ChromeDriverManager
 import json
 from datetime import datetime
@@ -274,80 +275,89 @@ def find_and_click_student(driver, student_name):
         # Search through the page by scrolling
         max_scrolls = 50
         scroll_attempt = 0
+        # Times the rows at one scroll position are fetched again after going stale
+        max_refetches = 3
+        refetches = 0
+        lname = student_name.lower()
         
         while scroll_attempt < max_scrolls:
             # Get currently visible table rows
-            try:
-                rows = driver.find_elements(By.XPATH, "//table//tr")
-                
-                for row in rows:
-                    try:
-                        row_text = row.text.strip()
-                        # Check if this row contains the student name
-                        if student_name.lower() in row_text.lower():
-                            print(f"✅ Found student in row: {row_text[:100]}...")
-                            
-                            # Scroll the row into view
-                            driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", row)
-                            time.sleep(2)
-                            
-                            # Try multiple clickable elements in the row
-                            clickable_approaches = [
-                                (".//td[1]//a", "link in first cell"),
-                                (".//a", "any link in row"),
-                                (".//td[1]", "first cell"),
-                                (".", "entire row")
-                            ]
-                            
-                            clickable_element = None
-                            approach_used = None
+            rows = driver.find_elements(By.XPATH, "//table//tr")
+            stale = False
+            
+            for row in rows:
+                try:
+                    row_text = row.text.strip()
+                    # Check if this row contains the student name
+                    if lname in row_text.lower():
+                        print(f"✅ Found student in row: {row_text[:100]}...")
+                        
+                        # Scroll the row into view
+                        driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", row)
+                        time.sleep(2)
+                        
+                        # Try multiple clickable elements in the row
+                        clickable_approaches = [
+                            (".//td[1]//a", "link in first cell"),
+                            (".//a", "any link in row"),
+                            (".//td[1]", "first cell"),
+                            (".", "entire row")
+                        ]
+                        
+                        clickable_element = None
+                        approach_used = None
+                        
+                        for xpath, description in clickable_approaches:
+                            try:
+                                clickable_element = row.find_element(By.XPATH, xpath)
+                                approach_used = description
+                                print(f"   📍 Found clickable element: {description}")
+                                break
+                            except NoSuchElementException:
+                                continue
+                        
+                        if clickable_element:
+                            print(f"🖱️  Clicking on student...")
                             
-                            for xpath, description in clickable_approaches:
-                                try:
-                                    clickable_element = row.find_element(By.XPATH, xpath)
-                                    approach_used = description
-                                    print(f"   📍 Found clickable element: {description}")
-                                    break
-                                except:
-                                    continue
+                            # Use JavaScript click to ensure it works
+                            driver.execute_script("arguments[0].click();", clickable_element)
+                            time.sleep(5)  # Wait for page to load
                             
-                            if clickable_element:
-                                print(f"🖱️  Clicking on student...")
-                                
-                                # Use JavaScript click to ensure it works
-                                driver.execute_script("arguments[0].click();", clickable_element)
-                                time.sleep(5)  # Wait for page to load
-                                
-                                # Check if we navigated to a new page - be more flexible
-                                new_url = driver.current_url
-                                page_title = driver.title
-                                
-                                # Check if we're on a student-specific page
-                                if (new_url != "https://app.alphamath.school/admin" and 
-                                    "admin" in new_url):
-                                    print(f"✅ Successfully navigated to student page!")
-                                    print(f"   URL: {new_url}")
-                                    print(f"   Title: {page_title}")
-                                    return True
-                                elif "Personal Information" in driver.page_source or student_name in driver.page_source:
-                                    print(f"✅ Successfully navigated to student page (detected by content)!")
-                                    print(f"   URL: {new_url}")
-                                    print(f"   Title: {page_title}")
-                                    return True
-                                else:
-                                    print(f"⚠️  Click didn't navigate to student page. Current URL: {new_url}")
-                                    return False
+                            # Check if we navigated to a new page - be more flexible
+                            new_url = driver.current_url
+                            page_title = driver.title
                             
-                    except Exception as e:
-                        continue
-                
-                # Scroll down and continue searching
-                driver.execute_script("window.scrollBy(0, 300);")
-                time.sleep(1)
-                scroll_attempt += 1
-                
-            except Exception as e:
-                break
+                            # Check if we're on a student-specific page
+                            if (new_url != "https://app.alphamath.school/admin" and 
+                                "admin" in new_url):
+                                print(f"✅ Successfully navigated to student page!")
+                                print(f"   URL: {new_url}")
+                                print(f"   Title: {page_title}")
+                                return True
+                            elif "Personal Information" in driver.page_source or student_name in driver.page_source:
+                                print(f"✅ Successfully navigated to student page (detected by content)!")
+                                print(f"   URL: {new_url}")
+                                print(f"   Title: {page_title}")
+                                return True
+                            else:
+                                print(f"⚠️  Click didn't navigate to student page. Current URL: {new_url}")
+                                return False
+                        
+                except StaleElementReferenceException:
+                    # The table re-rendered; fetch the rows again rather than failing on each one
+                    stale = True
+                    break
+            
+            # Re-check rows that re-rendered at this position before scrolling on
+            if stale and refetches < max_refetches:
+                refetches += 1
+                continue
+            refetches = 0
+            
+            # Scroll down and continue searching
+            driver.execute_script("window.scrollBy(0, 300);")
+            time.sleep(1)
+            scroll_attempt += 1
         
         print(f"❌ Could not find student after scrolling through table")
         return False